@@ -31,10 +31,10 @@ CSV_SEPARATOR_DOGEUSDT = "|"
 
 DOGE_DTYPES = {
     "timestamp": "Int64",
-    "open": "float64",
-    "high": "float64",
-    "low": "float64",
-    "close": "float64",
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
     "volume": "float64",
     "taker_buy_quote_asset_volume": "float64",
     "taker_buy_base_asset_volume": "float64",
@@ -42,16 +42,18 @@ DOGE_DTYPES = {
     "number_of_trades": "Int32",
 }
 
+DOGE_PRICE_COLUMNS = ["timestamp", "open"]
+
 POSTS_TEXT_COLUMN = "full_text"
 QUOTE_TEXT = ["orig_tweet_text", "musk_quote_tweet_text"]
 
 QUOTE_DTYPES = {
     "id": "int64",
     "orig_tweet_created_at": "object",
-    "orig_tweet_text": "string",
-    "orig_tweet_url": "string",
-    "orig_tweet_twitter_url": "string",
-    "orig_tweet_username": "string",
+    "orig_tweet_text": "string[pyarrow]",
+    "orig_tweet_url": "string[pyarrow]",
+    "orig_tweet_twitter_url": "string[pyarrow]",
+    "orig_tweet_username": "string[pyarrow]",
     "orig_tweet_retweet_count": "int64",
     "orig_tweet_reply_count": "int64",
     "orig_tweet_like_count": "int64",
@@ -59,7 +61,7 @@ QUOTE_DTYPES = {
     "orig_tweet_view_count": "float64",
     "orig_tweet_bookmark_count": "int64",
     "musk_tweet_id": "int64",
-    "musk_quote_tweet_text": "string",
+    "musk_quote_tweet_text": "string[pyarrow]",
     "musk_quote_retweet_count": "int64",
     "musk_quote_reply_count": "int64",
     "musk_quote_like_count": "int64",
@@ -72,31 +74,35 @@ QUOTE_DTYPES = {
 
 POSTS_DTYPES = {
     "id": "int64",
-    "url": "string",
-    "twitter_url": "string",
-    "full_text": "string",
-    "retweet_count": "Int64",
-    "reply_count": "Int64",
-    "like_count": "Int64",
-    "quote_count": "Int64",
+    "url": "string[pyarrow]",
+    "twitter_url": "string[pyarrow]",
+    "full_text": "string[pyarrow]",
+    "retweet_count": "Int32",
+    "reply_count": "Int32",
+    "like_count": "Int32",
+    "quote_count": "Int32",
     "view_count": "Int64",
     "created_at": "object",
-    "bookmark_count": "Int64",
-    "is_reply": "boolean",
-    "in_reply_to_id": "float64",
-    "conversation_id": "float64",
-    "in_reply_to_user_id": "float64",
-    "in_reply_to_username": "string",
-    "is_pinned": "boolean",
-    "is_retweet": "boolean",
-    "is_quote": "boolean",
-    "is_conversation_controlled": "boolean",
-    "possibly_sensitive": "boolean",
-    "quote_id": "float64",
-    "quote": "string",
-    "retweet": "string",
+    "bookmark_count": "Int32",
+    "is_reply": "bool[pyarrow]",
+    "in_reply_to_id": "Int64",
+    "conversation_id": "Int64",
+    "in_reply_to_user_id": "Int64",
+    "in_reply_to_username": "category",
+    "is_pinned": "bool[pyarrow]",
+    "is_retweet": "bool[pyarrow]",
+    "is_quote": "bool[pyarrow]",
+    "is_conversation_controlled": "bool[pyarrow]",
+    "possibly_sensitive": "bool[pyarrow]",
+    "quote_id": "Int64",
+    "quote": "string[pyarrow]",
+    "retweet": "string[pyarrow]",
 }
 
+# The processed tweets are written with UTC offsets, so the dashboard lets the
+# CSV reader parse 'created_at' and the Parquet cache stores it as a timestamp.
+PROCESSED_POSTS_DTYPES = {**POSTS_DTYPES, "created_at": "datetime64[ns, UTC]"}
+
 DOGE_KEYWORDS = ["dogecoin", "Ðoge", "crypto"]
 DOGE_KEYWORD = "doge"
 DEFAULT_DOGE_KEYWORDS = " dogecoin "
@@ -107,6 +113,18 @@ DOGE_MIN_DATE = "2019-07-05"
 
 RELATIVE_TIME_SPREAD_HOURS = 6 * 3600
 
+TWEET_MINUTE_TIMESTAMP_COLUMN = "timestamp_minute"
+
+# Each cached dashboard state holds both serialized figures, which can reach
+# about 100 MB for long date ranges with many tweets. Two entries bound the
+# cache at about 200 MB per worker process while still covering a switch
+# back to the previous filter state.
+DASHBOARD_CACHE_SIZE = 2
+
+PRICE_FIGURE_MAX_POINTS = 4000
+
+BACKGROUND_CACHE_EXPIRE_SECONDS = 24 * 3600
+
 DOGE_MAX_DATE = "2025-10-24"
 
 
@@ -136,7 +154,6 @@ HOVER_COLUMNS = [
     "quote_id",
     "quote",
     "retweet",
-    "timestamp",
 ]
 
 
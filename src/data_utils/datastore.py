@@ -0,0 +1,105 @@
+"""
+Shared, load-once access to the datasets used by the dashboard.
+
+Several dashboard modules need the same processed price and tweet data. This
+module loads and prepares each dataset on first access and hands out the same
+DataFrame afterwards, so the files are parsed once per process and every
+consumer sees identical dtypes. Callers must treat the returned DataFrames as
+read-only and copy them before making changes.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.config import config
+from src.data_utils import loaders, utils
+
+
+@lru_cache(maxsize=1)
+def get_stock_data() -> pd.DataFrame:
+    """
+    Returns the Dogecoin price history, loading it on the first call.
+
+    Only the columns listed in DOGE_PRICE_COLUMNS are kept. A UTC-aware
+    'created_at' column is derived from the Unix 'timestamp' column and the
+    rows are sorted by timestamp.
+
+    Returns:
+        pd.DataFrame: The shared price DataFrame.
+    """
+    df = loaders.load_data(
+        config.PROCESSED_DIR,
+        config.PROCESSED_DOGE_PRICE_PATH,
+        types=config.DOGE_DTYPES,
+        skiprows=1,
+        parquet_cache=True,
+        columns=config.DOGE_PRICE_COLUMNS,
+    )
+    df = utils.convert_unix_timestamp_to_datetime(df=df)
+
+    return df.sort_values("timestamp", ignore_index=True)
+
+
+@lru_cache(maxsize=1)
+def get_tweet_data() -> pd.DataFrame:
+    """
+    Returns the Dogecoin-related tweets, loading them on the first call.
+
+    A Unix 'timestamp' column is derived from 'created_at', together with a
+    copy floored to the minute (TWEET_MINUTE_TIMESTAMP_COLUMN) that the
+    impact analysis aligns against minute price data, and a formatted
+    'date_display' column ('YYYY-MM-DD HH:MM:SS' in UTC) is added for hover
+    labels using NumPy's datetime formatting, which is several times faster
+    than strftime. 'created_at' is parsed while reading the CSV, so the
+    Parquet cache keeps it as a timestamp and later loads skip the string
+    parsing. Text columns are Arrow-backed
+    strings as declared in PROCESSED_POSTS_DTYPES, and the rows are sorted
+    by timestamp.
+
+    Returns:
+        pd.DataFrame: The shared tweet DataFrame.
+    """
+    df = loaders.load_data(
+        config.PROCESSED_DIR,
+        config.PROCESSED_TWEETS_DOGECOIN_PATH,
+        types=config.PROCESSED_POSTS_DTYPES,
+        skiprows=1,
+        parquet_cache=True,
+    )
+    df = utils.convert_datetime_to_unix_timestamp(df=df)
+    df[config.TWEET_MINUTE_TIMESTAMP_COLUMN] = df["timestamp"] // 60 * 60
+    created_at = df["created_at"].to_numpy(dtype="datetime64[s]")
+    df["date_display"] = np.char.replace(
+        np.datetime_as_string(created_at), "T", " "
+    )
+
+    return df.sort_values("timestamp", ignore_index=True)
+
+
+@lru_cache(maxsize=1)
+def get_stock_timestamps() -> np.ndarray:
+    """
+    Returns the sorted Unix timestamps of the price data as an int64 array.
+
+    The array is aligned row-by-row with get_stock_data() and is built once,
+    so range lookups do not convert the nullable column on every call.
+
+    Returns:
+        np.ndarray: The price timestamps.
+    """
+    return get_stock_data()["timestamp"].to_numpy(dtype=np.int64)
+
+
+@lru_cache(maxsize=1)
+def get_tweet_timestamps() -> np.ndarray:
+    """
+    Returns the sorted Unix timestamps of the tweets as an int64 array.
+
+    The array is aligned row-by-row with get_tweet_data().
+
+    Returns:
+        np.ndarray: The tweet timestamps.
+    """
+    return get_tweet_data()["timestamp"].to_numpy(dtype=np.int64)
@@ -8,14 +8,19 @@ thousands separators.
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
+@lru_cache(maxsize=256)
 def convert_date_to_timestamp(
     date_string: str, date_format: str = "%Y-%m-%d"
 ) -> int:
     """
     Converts a date string in YYYY-MM-DD format to a Unix timestamp.
 
+    The date is read as midnight UTC. Results are memoized, since the
+    dashboard converts the same few picker values on every update.
+
     Args:
         date_string (str): The date string to convert.
         date_format (str): The expected format of the date string.
@@ -2,14 +2,270 @@
 Module for handling data I/O operations.
 
 This module provides utility functions to load datasets from disk into
-pandas DataFrames and save DataFrames back to CSV format, handling
-directory path construction and directory creation automatically.
+pandas DataFrames and save DataFrames back to CSV or Parquet format, handling
+directory path construction and directory creation automatically. Parsed CSV
+files can optionally be cached as Parquet so later loads skip CSV parsing.
 """
 
+import hashlib
+import json
 import os
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+PARQUET_EXTENSION = ".parquet"
+CACHE_OPTIONS_METADATA_KEY = b"load_options_hash"
+
+
+def _load_options_hash(
+    types: Optional[Dict[str, str]],
+    separator: Optional[str],
+    skiprows: int,
+) -> str:
+    """
+    Returns a hash of the options a CSV file is parsed with.
+
+    Args:
+        types (Optional[Dict[str, str]]): Column names mapped to dtypes.
+        separator (Optional[str]): The delimiter.
+        skiprows (int): Number of lines skipped at the start of the file.
+
+    Returns:
+        str: A hex digest identifying the options.
+    """
+    options = {
+        "types": (
+            None
+            if types is None
+            else [[name, str(dtype)] for name, dtype in types.items()]
+        ),
+        "separator": separator,
+        "skiprows": skiprows,
+    }
+
+    return hashlib.sha256(json.dumps(options).encode("utf-8")).hexdigest()
+
+
+def _is_cache_fresh(
+    cache_path: str, source_path: str, options_hash: str
+) -> bool:
+    """
+    Checks whether a cache file can be used instead of its source file.
+
+    The cache must exist, must not be older than the source, and must have
+    been written with the same parsing options.
+
+    Args:
+        cache_path (str): Path to the cached copy.
+        source_path (str): Path to the file the cache was built from.
+        options_hash (str): Hash of the current parsing options, as
+            returned by _load_options_hash.
+
+    Returns:
+        bool: True if the cache can be used instead of the source.
+    """
+    if not os.path.exists(cache_path) or os.path.getmtime(
+        cache_path
+    ) < os.path.getmtime(source_path):
+        return False
+
+    metadata = pq.read_schema(cache_path).metadata or {}
+
+    return metadata.get(CACHE_OPTIONS_METADATA_KEY) == options_hash.encode()
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str, options_hash: str) -> None:
+    """
+    Writes a parsed CSV to its Parquet cache, tagged with its options.
+
+    Args:
+        df (pd.DataFrame): The parsed dataset.
+        cache_path (str): Path of the cache file.
+        options_hash (str): Hash of the parsing options used for df.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            CACHE_OPTIONS_METADATA_KEY: options_hash.encode(),
+        }
+    )
+    pq.write_table(table, cache_path, compression="zstd")
+
+
+def _read_parquet(
+    file_path: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Reads a Parquet file through a memory map.
+
+    The file is mapped instead of copied into a read buffer, and the Arrow
+    table is released column by column while the DataFrame is built, which
+    lowers the peak memory of the load.
+
+    Args:
+        file_path (str): Path to the Parquet file.
+        columns (Optional[List[str]]): The columns to read. If None, all
+            columns are read.
+
+    Returns:
+        pd.DataFrame: The loaded dataset.
+    """
+    table = pq.read_table(
+        file_path, columns=columns, memory_map=True, use_threads=True
+    )
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _arrow_type(dtype: str) -> pa.DataType:
+    """
+    Returns the Arrow type a CSV column should be parsed as for a pandas dtype.
+
+    Numeric, boolean and timezone-aware datetime dtypes map to the matching
+    Arrow type, so Arrow parses them. Every other dtype (strings, categories,
+    objects) is parsed as a plain string and converted by pandas afterwards.
+
+    Args:
+        dtype (str): The pandas dtype of the column.
+
+    Returns:
+        pa.DataType: The Arrow type to parse the column as.
+    """
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return pa.timestamp(dtype.unit, tz=str(dtype.tz))
+
+    numpy_dtype = getattr(dtype, "numpy_dtype", dtype)
+    if isinstance(numpy_dtype, np.dtype) and numpy_dtype.kind in "biuf":
+        return pa.from_numpy_dtype(numpy_dtype)
+
+    return pa.string()
+
+
+def _arrow_backed(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """
+    Maps non-string Arrow types to Arrow-backed pandas dtypes.
+
+    Strings are left to the default conversion so they become Python
+    objects, which is what pandas would produce when parsing the CSV itself.
+
+    Args:
+        arrow_type (pa.DataType): The Arrow type of a column.
+
+    Returns:
+        Optional[pd.ArrowDtype]: The pandas dtype, or None for strings.
+    """
+    if pa.types.is_string(arrow_type):
+        return None
+
+    return pd.ArrowDtype(arrow_type)
+
+
+def _cast_integer_column(
+    column: pa.ChunkedArray, arrow_type: pa.DataType
+) -> pa.ChunkedArray:
+    """
+    Casts a column of integer text to an Arrow integer type.
+
+    pandas writes integer columns with missing values as floats, so such
+    files hold cells like '1659576000.0' or '1.3592223456789123e+18'. Plain
+    integer text is cast exactly; if a cell is float-formatted, the column
+    is read through float64 instead, which is exact for every value a float
+    column could have held.
+
+    Args:
+        column (pa.ChunkedArray): The column, parsed as strings.
+        arrow_type (pa.DataType): The integer type to cast to.
+
+    Returns:
+        pa.ChunkedArray: The integer column.
+
+    Raises:
+        pa.ArrowInvalid: If a value is not a whole number.
+    """
+    try:
+        return column.cast(arrow_type)
+    except pa.ArrowInvalid:
+        return column.cast(pa.float64()).cast(arrow_type)
+
+
+def _read_typed_csv(
+    file_path: str,
+    types: Dict[str, str],
+    separator: Optional[str] = None,
+    skiprows: int = 0,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Reads a CSV file with known column types using Arrow's CSV reader.
+
+    The file is parsed by Arrow's multi-threaded reader with every column
+    given an explicit type, so nothing is inferred. Integer columns are read
+    as text and cast afterwards, so float-formatted integers are accepted.
+    Numeric columns are handed to pandas as Arrow-backed arrays, which keeps
+    nullable integers exact, and all columns are then cast to the requested
+    dtypes. Quoted values may contain line breaks, as tweet texts do. Empty
+    cells, including empty strings, become missing values, as they do with
+    pd.read_csv.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        types (Dict[str, str]): Column names mapped to their pandas dtypes,
+            in file order. The keys are used as the column headers.
+        separator (Optional[str]): The single-character delimiter. Defaults
+            to a comma.
+        skiprows (int): Number of lines to skip at the start of the file.
+        columns (Optional[List[str]]): The columns to read. If None, all
+            columns are read.
+
+    Returns:
+        pd.DataFrame: The loaded dataset.
+    """
+    arrow_types = {name: _arrow_type(dtype) for name, dtype in types.items()}
+    integer_types = {
+        name: arrow_type
+        for name, arrow_type in arrow_types.items()
+        if pa.types.is_integer(arrow_type)
+    }
+
+    table = pacsv.read_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(
+            skip_rows=skiprows, column_names=list(types)
+        ),
+        parse_options=pacsv.ParseOptions(
+            delimiter=separator or ",", newlines_in_values=True
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                **arrow_types,
+                **dict.fromkeys(integer_types, pa.string()),
+            },
+            include_columns=columns,
+            strings_can_be_null=True,
+        ),
+    )
+    for name, arrow_type in integer_types.items():
+        index = table.schema.get_field_index(name)
+        if index >= 0:
+            table = table.set_column(
+                index,
+                name,
+                _cast_integer_column(table.column(index), arrow_type),
+            )
+
+    df = table.to_pandas(types_mapper=_arrow_backed, self_destruct=True)
+
+    return df.astype({name: types[name] for name in df.columns})
 
 
 def load_data(
@@ -18,24 +274,49 @@ def load_data(
     separator: str = None,
     types: Optional[Dict[str, str]] = None,
     skiprows: int = 0,
+    parquet_cache: bool = False,
+    columns: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """
-    Loads a CSV file into a pandas DataFrame from a constructed directory path.
+    Loads a CSV or Parquet file into a pandas DataFrame from a constructed
+    directory path.
 
     This function joins the directory components and filename, checks for the
     existence of the file, and reads it using specified formatting options.
+    Files ending in '.parquet' are read directly and the CSV options are
+    ignored.
+
+    When types are given, the CSV is parsed by Arrow's multi-threaded reader
+    with those types. Without types, pandas parses the file and infers the
+    column types as usual.
+
+    When parquet_cache is enabled, the parsed CSV is stored next to the
+    source as '<filename>.parquet'. Later calls read that copy instead of
+    parsing the CSV again, as long as it is not older than the CSV and was
+    written with the same types, separator and skiprows (a hash of these is
+    stored in the Parquet metadata); otherwise it is rebuilt. The cache
+    always holds every column, so different column selections can share it,
+    and is compressed with zstd, which keeps the large text columns small on
+    disk.
+    Parquet does not record every pandas dtype (Arrow-backed strings come
+    back as Python-backed ones), so the given types are applied again to
+    data read from the cache.
 
     Args:
         directory (List[str]): A list of strings representing the path
             components (e.g., ["data", "raw"]).
         filename (str): The name of the file to load (e.g., "results.csv").
-        separator (str, optional): The delimiter to use. If None, pandas will
-            attempt to detect it or use the default (usually a comma).
+        separator (str, optional): The delimiter to use. If None, a comma
+            is used. Must be a single character when types are given.
         types (Optional[Dict[str, str]], name): A dictionary mapping column
         names to their expected data types. If provided, these keys are also
         used as the column headers.
         skiprows (int): Number of lines to skip at the start of the file.
             Defaults to 0.
+        parquet_cache (bool): Whether to cache the parsed CSV as Parquet.
+            Defaults to False.
+        columns (Optional[List[str]]): The columns to keep, in the given
+            order. If None, all columns are returned.
 
     Returns:
         pd.DataFrame: The loaded dataset.
@@ -50,15 +331,48 @@ def load_data(
         message = f"The file {filename} does not exist in {directory}"
         raise FileNotFoundError(message)
 
-    kwargs = {}
-    if separator is not None:
-        kwargs["sep"] = separator
+    if filename.endswith(PARQUET_EXTENSION):
+        return _read_parquet(file_path, columns=columns)
+
+    cache_path = file_path + PARQUET_EXTENSION
+    options_hash = _load_options_hash(types, separator, skiprows)
+    if parquet_cache and _is_cache_fresh(cache_path, file_path, options_hash):
+        df = _read_parquet(cache_path, columns=columns)
+        if types is not None:
+            df = df.astype(
+                {name: types[name] for name in df.columns if name in types}
+            )
+
+        return df
+
+    usecols = columns if not parquet_cache else None
 
     if types is not None:
-        kwargs["names"] = types.keys()
-        kwargs["dtype"] = types
+        df = _read_typed_csv(
+            file_path,
+            types,
+            separator=separator,
+            skiprows=skiprows,
+            columns=usecols,
+        )
+    else:
+        kwargs = {}
+        if separator is not None:
+            kwargs["sep"] = separator
+
+        df = pd.read_csv(
+            file_path,
+            **kwargs,
+            skiprows=skiprows,
+            usecols=usecols,
+            low_memory=False,
+        )
+
+    if parquet_cache:
+        _write_cache(df, cache_path, options_hash)
 
-    df = pd.read_csv(file_path, **kwargs, skiprows=skiprows, low_memory=False)
+    if columns is not None:
+        df = df[columns]
 
     return df
 
@@ -67,17 +381,20 @@ def save_data(
     directory: List[str], filename: str, df: pd.DataFrame, index: bool = False
 ) -> None:
     """
-    Saves a pandas DataFrame to a CSV file in a specified directory.
+    Saves a pandas DataFrame to a CSV or Parquet file in a specified directory.
 
     This function constructs a directory path from a list of strings,
     ensures the directory exists (creating it if necessary), and
     writes the DataFrame to a CSV file without including the index.
+    Filenames ending in '.parquet' are written in zstd-compressed Parquet
+    format instead.
 
     Args:
         directory (List[str]): A list of strings representing the path
             components where the file should be saved
             (e.g., ["data", "processed"]).
-        filename (str): The name of the file to be saved (e.g., "output.csv").
+        filename (str): The name of the file to be saved (e.g., "output.csv"
+            or "output.parquet").
         df (pd.DataFrame): The pandas DataFrame to be exported.
         index (bool): Maintain index.
 
@@ -88,9 +405,11 @@ def save_data(
         save_data(["exports", "daily"], "report.csv", my_dataframe)
     """
     directory_path = os.path.join(*directory)
-    if not os.path.exists(directory_path):
-        os.makedirs(directory_path)
+    os.makedirs(directory_path, exist_ok=True)
 
     file_path = os.path.join(directory_path, filename)
 
-    df.to_csv(file_path, index=index)
+    if filename.endswith(PARQUET_EXTENSION):
+        df.to_parquet(file_path, index=index, compression="zstd")
+    else:
+        df.to_csv(file_path, index=index)
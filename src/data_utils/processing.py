@@ -7,9 +7,13 @@ and asset pricing. It includes logic for keyword-based filtering across multiple
 text columns and temporal alignment between tweet timestamps and stock market data.
 """
 
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pandas import DataFrame
 
 from src.config.config import (
@@ -18,6 +22,95 @@ from src.config.config import (
     QUOTE_TEXT,
 )
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal_pattern(pattern: str) -> bool:
+    """
+    Checks whether a search pattern contains no regular expression syntax.
+
+    Args:
+        pattern (str): The pattern to inspect.
+
+    Returns:
+        bool: True if the pattern can be matched as a plain substring.
+    """
+    return _REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> str:
+    """
+    Builds a regular expression that matches any of the keywords literally.
+
+    The pattern is kept as a string rather than a compiled ``re.Pattern``
+    because Arrow's regex kernel only accepts string patterns.
+
+    Args:
+        keywords (Tuple[str, ...]): The keywords to combine.
+
+    Returns:
+        str: The escaped alternation of all keywords.
+    """
+    return "|".join(map(re.escape, keywords))
+
+
+def _contains(series: pd.Series, pattern: str, regex: bool) -> np.ndarray:
+    """
+    Checks case-insensitively which entries of a text column match a pattern.
+
+    Arrow-backed columns are searched with RE2, which does not support
+    lookarounds or backreferences. Patterns RE2 rejects are retried with
+    Python's ``re`` on an object copy of the column, and patterns that are
+    not valid regular expressions at all match nothing.
+
+    Args:
+        series (pd.Series): The text column to search.
+        pattern (str): The substring or regular expression to look for.
+        regex (bool): Whether the pattern is a regular expression.
+
+    Returns:
+        np.ndarray: A boolean mask, False for missing values.
+    """
+    try:
+        try:
+            mask = series.str.contains(
+                pattern, case=False, na=False, regex=regex
+            )
+        except pa.ArrowInvalid:
+            mask = series.astype(object).str.contains(
+                pattern, case=False, na=False, regex=regex
+            )
+    except re.error:
+        return np.zeros(len(series), dtype=bool)
+
+    return mask.to_numpy(dtype=bool)
+
+
+def _contains_any_keyword(
+    series: pd.Series, keywords: List[str]
+) -> np.ndarray:
+    """
+    Checks which entries of a text column contain any of the given keywords.
+
+    The keywords are matched literally and case-insensitively. The column is
+    scanned as Arrow-backed strings, where the alternation of all keywords is
+    compiled by RE2 into a single automaton, so every text is read once
+    regardless of the number of keywords.
+
+    Args:
+        series (pd.Series): The text column to search.
+        keywords (List[str]): The keywords to look for.
+
+    Returns:
+        np.ndarray: A boolean mask, False for missing values.
+    """
+    return _contains(
+        series.astype("string[pyarrow]"),
+        _keyword_pattern(tuple(keywords)),
+        regex=True,
+    )
+
 
 def calculate_avg_price_at_tweet_time(
     tweet_df: pd.DataFrame, stock_df: pd.DataFrame
@@ -26,6 +119,10 @@ def calculate_avg_price_at_tweet_time(
     Calculates the average asset price at the specific minutes tweets were
     posted by rounding timestamps to the nearest minute.
 
+    Timestamps are floored to whole minutes as integers, and each tweet is
+    matched to the first price of its minute by a binary search over the
+    sorted stock minutes, so no datetime conversion or merge is needed.
+
     Args:
         tweet_df (pd.DataFrame): DataFrame containing tweet data with
                                 a 'timestamp' column.
@@ -40,30 +137,202 @@ def calculate_avg_price_at_tweet_time(
     if tweet_df.empty or stock_df.empty:
         return 0.0
 
-    tweet_minutes = pd.to_datetime(tweet_df["timestamp"], unit="s").dt.floor(
-        "min"
-    )
-    stock_minutes = pd.to_datetime(stock_df["timestamp"], unit="s").dt.floor(
-        "min"
+    tweet_minutes = tweet_df["timestamp"].to_numpy(dtype=np.int64) // 60
+    stock_minutes = stock_df["timestamp"].to_numpy(dtype=np.int64) // 60
+    prices = stock_df["open"].to_numpy(dtype=np.float64)
+
+    order = np.argsort(stock_minutes, kind="stable")
+    unique_minutes, first_rows = np.unique(
+        stock_minutes[order], return_index=True
     )
+    unique_prices = prices[order][first_rows]
+
+    positions = np.searchsorted(unique_minutes, tweet_minutes)
+    positions = np.minimum(positions, len(unique_minutes) - 1)
+    matched = unique_prices[
+        positions[unique_minutes[positions] == tweet_minutes]
+    ]
+    matched = matched[~np.isnan(matched)]
+
+    if not len(matched):
+        return 0.0
+
+    return float(matched.mean())
+
 
-    price_lookup = pd.DataFrame(
-        {"align_dt": stock_minutes, "price": stock_df["open"]}
-    ).drop_duplicates(subset=["align_dt"])
+def select_time_range(
+    df: pd.DataFrame, timestamps: np.ndarray, start: int, end: int
+) -> DataFrame:
+    """
+    Selects the rows whose timestamp falls within an inclusive range.
+
+    The bounds are located with a binary search, so ``timestamps`` must be
+    sorted in ascending order and aligned row-by-row with ``df``. This avoids
+    building boolean masks over the full DataFrame on every call.
+
+    Args:
+        df (pd.DataFrame): DataFrame sorted by its timestamp column.
+        timestamps (np.ndarray): The sorted Unix timestamps of ``df``.
+        start (int): The first Unix timestamp to include.
+        end (int): The last Unix timestamp to include.
+
+    Returns:
+        pd.DataFrame: A positional slice of ``df`` covering the range.
+    """
+    lower = np.searchsorted(timestamps, start, side="left")
+    upper = np.searchsorted(timestamps, end, side="right")
+
+    return df.iloc[lower:upper]
+
+
+def downsample_min_max(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Selects at most ``max_points`` positions that preserve a series' shape.
+
+    The series is split into ``max_points // 2`` equally sized buckets and
+    the positions of the lowest and highest value of every bucket are kept,
+    so spikes and dips stay visible when a long series is plotted with far
+    fewer points than it has. Series that are already short enough are
+    returned whole.
+
+    Args:
+        values (np.ndarray): The series to reduce. Missing values are never
+            chosen as a bucket's extreme unless the whole bucket is missing.
+        max_points (int): The maximum number of positions to return.
+
+    Returns:
+        np.ndarray: Sorted, unique positions into ``values``.
+    """
+    count = len(values)
+    n_buckets = max(max_points // 2, 1)
+    if count <= max_points:
+        return np.arange(count)
+
+    bucket_size = -(-count // n_buckets)
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:count] = values
+    buckets = padded.reshape(n_buckets, bucket_size)
+    missing = np.isnan(buckets)
+
+    starts = np.arange(n_buckets) * bucket_size
+    lows = starts + np.argmin(np.where(missing, np.inf, buckets), axis=1)
+    highs = starts + np.argmax(np.where(missing, -np.inf, buckets), axis=1)
+    positions = np.unique(np.concatenate([lows, highs]))
+
+    return positions[positions < count]
+
+
+def compute_tweet_impacts(
+    stock_timestamps: np.ndarray,
+    stock_prices: np.ndarray,
+    tweet_times: np.ndarray,
+    spread: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Normalizes the price windows around a batch of tweets in one pass.
+
+    For each tweet, the prices within ``spread`` seconds on either side are
+    divided by the price closest to the tweet time (the earlier one on ties).
+    The windows of all tweets are computed with array operations and returned
+    concatenated, so no per-tweet Python work is needed for the numbers.
+
+    Args:
+        stock_timestamps (np.ndarray): Sorted Unix timestamps of the prices.
+        stock_prices (np.ndarray): Prices aligned with ``stock_timestamps``.
+        tweet_times (np.ndarray): Unix timestamps of the tweets.
+        spread (int): Half-width of each window in seconds.
 
-    tweets_with_price = pd.merge(
-        pd.DataFrame({"align_dt": tweet_minutes}),
-        price_lookup,
-        on="align_dt",
-        how="left",
+    Returns:
+        tuple: A 4-element tuple containing:
+            - np.ndarray: Hours relative to the tweet for every window point.
+            - np.ndarray: Prices normalized to the price at tweet time.
+            - np.ndarray: Offsets of length ``len(tweet_times) + 1``; tweet
+              ``i`` owns the slice ``offsets[i]:offsets[i + 1]``.
+            - np.ndarray: Index of the highest normalized price after each
+              tweet within the concatenated arrays, or -1 if there is none.
+    """
+    tweet_times = np.asarray(tweet_times, dtype=np.int64)
+
+    lowers = np.searchsorted(stock_timestamps, tweet_times - spread, "left")
+    uppers = np.searchsorted(stock_timestamps, tweet_times + spread, "right")
+    lengths = uppers - lowers
+
+    offsets = np.zeros(len(tweet_times) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    segments = np.repeat(np.arange(len(tweet_times)), lengths)
+    positions = (
+        np.arange(offsets[-1]) - offsets[segments] + lowers[segments]
     )
 
-    avg_val = tweets_with_price["price"].mean()
+    nearest = np.searchsorted(stock_timestamps, tweet_times, "left")
+    nearest = np.clip(nearest, lowers, np.maximum(uppers - 1, lowers))
+    previous = np.maximum(nearest - 1, lowers)
+    has_window = lengths > 0
+    nearest, previous = nearest[has_window], previous[has_window]
+    window_times = tweet_times[has_window]
+    use_previous = (
+        window_times - stock_timestamps[previous]
+        <= stock_timestamps[nearest] - window_times
+    )
+    pivots = np.zeros(len(tweet_times), dtype=np.float64)
+    pivots[has_window] = stock_prices[
+        np.where(use_previous, previous, nearest)
+    ]
+
+    window_timestamps = stock_timestamps[positions]
+    normalized_prices = stock_prices[positions] / pivots[segments]
+    relative_hours = (window_timestamps - tweet_times[segments]) / 3600
+
+    peak_indices = np.full(len(tweet_times), -1, dtype=np.int64)
+    after = np.flatnonzero(window_timestamps > tweet_times[segments])
+    if len(after):
+        order = np.lexsort(
+            (after, -normalized_prices[after], segments[after])
+        )
+        ranked = after[order]
+        is_first = np.r_[True, segments[ranked][1:] != segments[ranked][:-1]]
+        peak_indices[segments[ranked[is_first]]] = ranked[is_first]
+
+    return relative_hours, normalized_prices, offsets, peak_indices
+
+
+def average_by_relative_time(
+    relative_hours: np.ndarray, normalized_prices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Averages the normalized prices of all tweets at each relative time.
 
-    if pd.isna(avg_val):
-        return 0.0
+    The relative times come from whole-second timestamp differences, so they
+    are grouped by their offset in seconds and summed with ``np.bincount``
+    instead of a hash-based groupby. The returned times are rounded to four
+    decimal places of an hour.
 
-    return float(avg_val)
+    Args:
+        relative_hours (np.ndarray): Hours relative to each tweet, as
+            returned by ``compute_tweet_impacts``.
+        normalized_prices (np.ndarray): Normalized prices aligned with
+            ``relative_hours``.
+
+    Returns:
+        tuple: A 2-element tuple containing:
+            - np.ndarray: The distinct relative hours, in ascending order.
+            - np.ndarray: The mean normalized price at each of those hours.
+    """
+    if not len(relative_hours):
+        return np.empty(0), np.empty(0)
+
+    seconds = np.rint(np.asarray(relative_hours) * 3600).astype(np.int64)
+    first = seconds.min()
+    bins = seconds - first
+
+    counts = np.bincount(bins)
+    sums = np.bincount(bins, weights=normalized_prices)
+    present = np.flatnonzero(counts)
+
+    hours = np.round((present + first) / 3600, 4)
+
+    return hours, sums[present] / counts[present]
 
 
 def filter_tweets_by_keyword(
@@ -73,6 +342,10 @@ def filter_tweets_by_keyword(
     Filters a DataFrame for rows where the text column contains a specific keyword.
 
     The search is case-insensitive and handles missing (NaN) values by excluding them.
+    Keywords without regular expression syntax are matched as plain substrings,
+    which skips the regex engine (and uses Arrow's substring kernel on
+    Arrow-backed string columns). Patterns that are not valid regular
+    expressions match no rows.
 
     Args:
         df (pd.DataFrame): The DataFrame containing tweet or post data.
@@ -88,9 +361,11 @@ def filter_tweets_by_keyword(
     if not keyword:
         return df
 
-    mask = df[text_column].str.contains(keyword, case=False, na=False)
+    mask = _contains(
+        df[text_column], keyword, regex=not _is_literal_pattern(keyword)
+    )
 
-    return df[mask].copy()
+    return df[mask]
 
 
 def get_posts_related_to_dogecoin(
@@ -114,11 +389,9 @@ def get_posts_related_to_dogecoin(
     if text_column is None:
         text_column = POSTS_TEXT_COLUMN
 
-    regex_pattern = "|".join(doge_keywords)
-
-    mask = df[text_column].str.contains(regex_pattern, case=False, na=False)
+    mask = _contains_any_keyword(df[text_column], doge_keywords)
 
-    return df[mask].copy()
+    return df[mask]
 
 
 def get_repost_related_to_dogecoin_quote(
@@ -145,15 +418,9 @@ def get_repost_related_to_dogecoin_quote(
     if text_columns is None:
         text_columns = QUOTE_TEXT
 
-    regex_pattern = "|".join(doge_keywords)
-
-    mask_orig = df[text_columns[0]].str.contains(
-        regex_pattern, case=False, na=False
-    )
-    mask_quote = df[text_columns[1]].str.contains(
-        regex_pattern, case=False, na=False
-    )
+    mask_orig = _contains_any_keyword(df[text_columns[0]], doge_keywords)
+    mask_quote = _contains_any_keyword(df[text_columns[1]], doge_keywords)
 
     final_mask = mask_orig | mask_quote
 
-    return df[final_mask].copy()
+    return df[final_mask]
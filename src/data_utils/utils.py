@@ -7,7 +7,6 @@ specifically optimized for handling tweet DataFrames and ensuring data integrity
 before analysis.
 """
 
-from datetime import datetime
 from typing import List, Tuple
 
 import pandas as pd
@@ -16,6 +15,7 @@ from pandas import DataFrame
 from src.config.config import (
     FIRST_MENTION_OF_DEPARTMENT_OF_GOVERNMENT_EFFICIENCY_DATE,
 )
+from src.data_utils.formatters import convert_date_to_timestamp
 
 
 def convert_datetime_to_unix_timestamp(
@@ -29,6 +29,11 @@ def convert_datetime_to_unix_timestamp(
     WARNING: Uses errors="raise". If any date string is invalid, this function
     will raise a ValueError and crash the calling program unless handled externally.
 
+    The dates are parsed as ISO 8601, which skips per-row format inference,
+    and the seconds are taken by casting the datetime array instead of
+    dividing the nanosecond values. The input DataFrame is left unchanged,
+    but the returned one shares its other columns instead of copying them.
+
     Args:
         df: The input DataFrame.
         date_column: The name of the column containing date-time values.
@@ -38,12 +43,14 @@ def convert_datetime_to_unix_timestamp(
         The DataFrame with the new timestamp column added.
     """
 
-    df = df.copy()
-    df[date_column] = pd.to_datetime(df[date_column], utc=True, errors="raise")
-
-    df[new_column_name] = df[date_column].astype(int) // 10**9
+    df = df.copy(deep=False)
+    df[date_column] = pd.to_datetime(
+        df[date_column], utc=True, errors="raise", format="ISO8601"
+    )
 
-    df[new_column_name] = df[new_column_name].astype("int64")
+    df[new_column_name] = (
+        df[date_column].values.astype("datetime64[s]").view("int64")
+    )
 
     return df
 
@@ -80,6 +87,9 @@ def drop_tweets_before_date(
     """
     Removes tweets from the DataFrame that occurred before a specific cutoff date.
 
+    The cutoff is midnight UTC at the start of cutoff_date, independent of
+    the local time zone, and is compared against the raw timestamp array.
+
     Args:
         df: The input DataFrame containing tweet data.
         timestamp_column: The name of the column containing Unix timestamps.
@@ -88,12 +98,10 @@ def drop_tweets_before_date(
     Returns:
         A filtered copy of the DataFrame containing only tweets posted before the cutoff.
     """
-    cutoff_timestamp = datetime.strptime(cutoff_date, "%Y-%m-%d").timestamp()
-    mask = df[timestamp_column] < cutoff_timestamp
-
-    df_filtered = df[mask].copy()
+    cutoff_timestamp = convert_date_to_timestamp(cutoff_date)
+    mask = df[timestamp_column].to_numpy() < cutoff_timestamp
 
-    return df_filtered
+    return df[mask]
 
 
 def find_duplicates(
@@ -111,7 +119,7 @@ def find_duplicates(
         The total count of duplicate rows found in the DataFrame.
     """
 
-    duplicates = df[df.duplicated(subset=subset_columns, keep=False)].copy()
+    duplicates = df[df.duplicated(subset=subset_columns, keep=False)]
 
     output = pd.DataFrame(columns=display_duplicates)
     if not duplicates.empty:
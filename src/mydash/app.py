@@ -3,14 +3,26 @@ Dash application initialization module.
 This module configures the Dash app instance, themes, and multi-page routing.
 """
 
+import uuid
+
 import dash_bootstrap_components as dbc
 import diskcache
 from dash import Dash, DiskcacheManager
 
+from src.config.config import BACKGROUND_CACHE_EXPIRE_SECONDS
 from src.mydash import router
 
+# Background callback results are memoized by their inputs, so re-selecting a
+# tweet with the same windows skips the model fit. The launch id keeps results
+# from a previous run of the app (and possibly older data) from being reused.
+launch_uid = uuid.uuid4()
+
 cache = diskcache.Cache("./.cache")
-background_callback_manager = DiskcacheManager(cache)
+background_callback_manager = DiskcacheManager(
+    cache,
+    cache_by=[lambda: launch_uid],
+    expire=BACKGROUND_CACHE_EXPIRE_SECONDS,
+)
 
 
 external_stylesheets = [dbc.themes.CYBORG, dbc.icons.FONT_AWESOME]
@@ -40,7 +40,7 @@ from src.data_utils import loaders
 logger = logging.getLogger(__name__)
 matplotlib.use("Agg")
 
-CRYPTOS_MASTER = loaders.load_data(config.PROCESSED_DIR, config.PROCESSED_CRYPTOS_PATH)
+CRYPTOS_MASTER = loaders.load_data(config.PROCESSED_DIR, config.PROCESSED_CRYPTOS_PATH, parquet_cache=True)
 CRYPTOS_MASTER["timestamp"] = pd.to_datetime(CRYPTOS_MASTER["timestamp"])
 CRYPTOS_MASTER.set_index("timestamp", inplace=True)
 CRYPTOS_MASTER.sort_index(inplace=True)
@@ -51,7 +51,7 @@ def create_tweet_selector_table(selected_row: dict) -> dbc.Card:
     Generates a Bootstrap Card containing detailed metadata for a selected tweet.
 
     This function extracts data from a specific row in the DataTable based on
-    user interaction and builds a vertical key-value display. It uses monospaced
+    user interaction and builds a vertical key-value table. It uses monospaced
     fonts and high-contrast colors to ensure tweet metadata (like ID and text)
     is easily readable.
 
@@ -80,28 +80,24 @@ def create_tweet_selector_table(selected_row: dict) -> dbc.Card:
         html.Hr(className="text-secondary"),
     ]
 
-    for col_name, value in selected_row.items():
-        display_name = col_name
-
-        display_value = str(value)
-
-        details_content.append(
-            dbc.Row(
+    details_content.append(
+        html.Table(
+            html.Tbody(
                 [
-                    dbc.Col(
-                        html.B(f"{display_name}"),
-                        width=4,
-                        className="text-primary font-monospace",
-                    ),
-                    dbc.Col(
-                        html.Span(display_value),
-                        width=8,
-                        className="text-white",
-                    ),
-                ],
-                className="mb-2 py-1 border-bottom border-secondary border-opacity-25",
-            )
+                    html.Tr(
+                        [
+                            html.Th(col_name, className="w-25 text-primary font-monospace"),
+                            html.Td(str(value), className="text-white"),
+                        ],
+                        className="border-bottom border-secondary border-opacity-25",
+                    )
+                    for col_name, value in selected_row.items()
+                ]
+            ),
+            className="table table-borderless table-sm mb-0",
+            style={"--bs-table-bg": "transparent"},
         )
+    )
 
     return dbc.Card(
         dbc.CardBody(details_content),
@@ -162,9 +158,7 @@ def create_causal_impact_figure(
 
     analysis_start = pd.to_datetime(pre_period[0])
     analysis_end = pd.to_datetime(post_period[1])
-    data_ci = CRYPTOS_MASTER.loc[analysis_start:analysis_end].copy()
-
-    data_ci = data_ci.dropna(axis=1, how="any")
+    data_ci = CRYPTOS_MASTER.loc[analysis_start:analysis_end].dropna(axis=1, how="any")
 
     ci = causalimpact.CausalImpact(data_ci, pre_period, post_period)
 
@@ -181,6 +175,10 @@ def create_causal_impact_figure(
     State("tweet-selector-table", "data"),
     Input("tweet-selector-table", "active_cell"),
     background=True,
+    running=[
+        (Output("num-from-input-causalimpact", "disabled"), True, False),
+        (Output("num-to-input-causalimpact", "disabled"), True, False),
+    ],
     prevent_initial_call=True,
 )
 def display_row_details(
@@ -195,7 +193,9 @@ def display_row_details(
     This primary callback triggers whenever a user selects a new tweet or
     adjusts the time windows. It handles the end-to-end pipeline: generating
     the metadata card, running the Bayesian model, rendering the Matplotlib
-    figure to a base64 string, and cleaning the statistical text summaries.
+    figure to a base64 SVG string, and cleaning the statistical text summaries.
+    It runs as a background job, and the window inputs are disabled while it
+    runs so that a new fit is not queued behind one still in progress.
 
     Args:
         num_from (int): Training window duration from the numeric input.
@@ -206,7 +206,7 @@ def display_row_details(
     Returns:
         tuple: A 4-element tuple containing:
             - card (dbc.Card): The metadata display for the selected tweet.
-            - img_src (str): Base64 encoded PNG string of the impact plot.
+            - img_src (str): Base64 encoded SVG string of the impact plot.
             - summary (str): A cleaned, multi-line string of quantitative metrics.
             - report (str): The full linguistic interpretation of the causal analysis.
     """
@@ -229,14 +229,14 @@ def display_row_details(
         fig = plt.gcf()
 
         buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
+        fig.savefig(buf, format="svg", bbox_inches="tight")
 
         plt.close("all")
 
         encoded_image = base64.b64encode(buf.getvalue()).decode("utf-8")
         return (
             card,
-            f"data:image/png;base64,{encoded_image}",
+            f"data:image/svg+xml;base64,{encoded_image}",
             "\n".join(ci.summary().splitlines()[:-1]),
             ci.summary("report"),
         )
@@ -8,9 +8,8 @@ Plotly visualizations to reveal correlation patterns between influencer
 activity and cryptocurrency volatility.
 
 Key Functionalities:
-    - Data Initialization: Loads and synchronizes multi-source datasets
-      (Binance price history and Twitter/X archives) with optimized timestamp
-      conversions.
+    - Data Access: Reads the shared Binance price history and Twitter/X
+      archives through ``datastore``, which loads them lazily on first use.
     - Multi-Axis Plotting: Constructs primary price-volume figures with
       overlaid event markers and standardized unified hover templates.
     - Normalization Analysis: Calculates and visualizes "Tweet Impact"
@@ -22,88 +21,209 @@ Key Functionalities:
       milestones, such as the initial mention of the DOGE department.
 """
 
+import base64
+import json
+from functools import lru_cache
+from itertools import cycle
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Input, Output, State, callback
+import plotly.io as pio
+from dash import Input, Output, Patch, State, callback, ctx, no_update
 
-from src.config import config
 from src.config.config import (
+    DASHBOARD_CACHE_SIZE,
     FIRST_MENTION_OF_DEPARTMENT_OF_GOVERNMENT_EFFICIENCY_DATE,
     HOVER_COLUMNS,
     POSTS_TEXT_COLUMN,
+    PRICE_FIGURE_MAX_POINTS,
     RELATIVE_TIME_SPREAD_HOURS,
+    TWEET_MINUTE_TIMESTAMP_COLUMN,
 )
-from src.data_utils import formatters, loaders, processing, utils
+from src.data_utils import datastore, formatters, processing
 
-STOCK_DATA = loaders.load_data(
-    config.PROCESSED_DIR,
-    config.PROCESSED_DOGE_PRICE_PATH,
-    types=config.DOGE_DTYPES,
-    skiprows=1,
+FULL_HOVERTEMPLATE = (
+    "<br>".join(f"<b>{col}:</b> %{{customdata[{i}]}}" for i, col in enumerate(HOVER_COLUMNS)) + "<extra></extra>"
 )
 
-TWEET_DATA = loaders.load_data(
-    config.PROCESSED_DIR,
-    config.PROCESSED_TWEETS_DOGECOIN_PATH,
-    types=config.POSTS_DTYPES,
-    skiprows=1,
-)
+MAIN_FIGURE_LAYOUT = go.Layout(
+    template="plotly_dark",
+    hovermode="x unified",
+    xaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
+    yaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
+    height=900,
+    font={"size": 18},
+    xaxis_title={"text": "Time", "font": {"size": 20}},
+    yaxis_title={"text": "USDT", "font": {"size": 20}},
+    legend={
+        "font": {"size": 16},
+        "orientation": "h",
+        "yanchor": "top",
+        "y": -0.2,
+        "xanchor": "center",
+        "x": 0.5,
+    },
+    hoverlabel={"font_size": 18},
+).to_plotly_json()
+
+IMPACT_FIGURE_LAYOUT = go.Layout(
+    title={
+        "text": "Price Impact: 6 hours Before vs 6 hours after Tweets",
+        "font": {"size": 24},
+    },
+    template="plotly_dark",
+    xaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
+    yaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
+    xaxis_title={"text": "Hours relative to Tweet", "font": {"size": 20}},
+    yaxis_title={"text": "Normalized Price", "font": {"size": 20}},
+    hovermode="closest",
+    height=900,
+    font={"size": 18},
+    legend={
+        "font": {"size": 16},
+        "orientation": "v",
+        "yanchor": "top",
+        "y": -0.2,
+        "xanchor": "center",
+        "x": 0.5,
+    },
+).to_plotly_json()
+
+
+def _typed_array(values: np.ndarray) -> dict:
+    """
+    Encodes a numeric array in Plotly's base64 typed-array format.
+
+    Graph objects apply this encoding automatically; figures assembled as
+    dictionaries need it explicitly to avoid sending long JSON number lists.
+    Single-precision input is sent as 4-byte floats, everything else as
+    8-byte floats.
+
+    Args:
+        values (np.ndarray): The values to encode.
+
+    Returns:
+        dict: A typed-array specification with 'dtype' and 'bdata' keys.
+    """
+    dtype = "f4" if values.dtype == np.float32 else "f8"
+    array = np.ascontiguousarray(values, dtype=f"<{dtype}")
 
-STOCK_DATA = utils.convert_unix_timestamp_to_datetime(df=STOCK_DATA)
-TWEET_DATA = utils.convert_datetime_to_unix_timestamp(df=TWEET_DATA)
+    return {"dtype": dtype, "bdata": base64.b64encode(array).decode("ascii")}
+
+
+def _price_trace_values(coin_stock_df: pd.DataFrame) -> dict:
+    """
+    Returns the x and y values of the price line for a range of price data.
+
+    Ranges longer than PRICE_FIGURE_MAX_POINTS rows are reduced to the lowest
+    and highest price of evenly sized buckets; shorter ranges are plotted at
+    full resolution.
+
+    Args:
+        coin_stock_df (pd.DataFrame): Price data with 'created_at' and 'open'.
+
+    Returns:
+        dict: The trace's 'x' (naive UTC datetimes) and 'y' (typed array) values.
+    """
+    price_df = coin_stock_df.iloc[
+        processing.downsample_min_max(coin_stock_df["open"].to_numpy(), PRICE_FIGURE_MAX_POINTS)
+    ]
+
+    return {
+        "x": price_df["created_at"].dt.tz_localize(None).to_numpy(),
+        "y": _typed_array(price_df["open"].to_numpy()),
+    }
+
+
+def _relayout_time_range(relayout_data: dict | None) -> tuple[int, int] | None:
+    """
+    Extracts the zoomed time range of the price figure from a relayout event.
+
+    Args:
+        relayout_data (dict | None): The graph's ``relayoutData``.
+
+    Returns:
+        tuple[int, int] | None: Unix timestamps of the visible range, or None
+            if the event does not set an explicit x-axis range.
+    """
+    if not relayout_data:
+        return None
+
+    x_range = relayout_data.get("xaxis.range") or [
+        relayout_data.get("xaxis.range[0]"),
+        relayout_data.get("xaxis.range[1]"),
+    ]
+    if len(x_range) != 2 or None in x_range:
+        return None
+
+    try:
+        start, end = (int(pd.Timestamp(value, tz="UTC").timestamp()) for value in x_range)
+    except (TypeError, ValueError):
+        return None
+
+    return start, end
+
+
+def _price_trace_for_range(start_timestamp: int, end_timestamp: int) -> dict:
+    """
+    Returns the price line values for a time range, see _price_trace_values.
+
+    Args:
+        start_timestamp (int): Unix timestamp of the range start.
+        end_timestamp (int): Unix timestamp of the range end.
+
+    Returns:
+        dict: The trace's 'x' and 'y' values.
+    """
+    coin_stock_df = processing.select_time_range(
+        datastore.get_stock_data(),
+        datastore.get_stock_timestamps(),
+        start_timestamp,
+        end_timestamp,
+    )
+
+    return _price_trace_values(coin_stock_df)
 
 
 def _build_main_price_figure(
-    coin_stock_df: pd.DataFrame, coin_tweet_df: pd.DataFrame
-) -> tuple[go.Figure, str, list[str]]:
+    coin_stock_df: pd.DataFrame, coin_tweet_df: pd.DataFrame, mean_price: float
+) -> tuple[dict, list[str]]:
     """
-    Constructs the primary price-volume Scatter plot and generates visual metadata.
+    Constructs the primary price-volume plot and generates visual metadata.
 
     This helper function handles the dark-mode layout configuration, plots the
-    asset price line, adds vertical markers for tweet events, and constructs
-    the standardized hover template used across dashboard figures.
+    asset price line with WebGL so long minute histories render as a single
+    buffer, and adds vertical markers and hover points for tweet events. Long
+    price histories are reduced to the lowest and highest price of evenly
+    sized buckets (at most PRICE_FIGURE_MAX_POINTS points) before plotting;
+    update_price_resolution re-samples the visible range on zoom. The
+    figure is assembled as a plain dictionary, which skips the validation and deep
+    copies that graph objects perform for every trace.
 
     Args:
         coin_stock_df (pd.DataFrame): DataFrame containing stock price data
             with 'created_at' and 'open' columns.
         coin_tweet_df (pd.DataFrame): DataFrame containing filtered tweet data
             with 'created_at' and content columns.
+        mean_price (float): Mean 'open' price of coin_stock_df, used as the
+            height of the tweet hover markers.
 
     Returns:
-        tuple: A 3-element tuple containing:
-            - fig (go.Figure): The main Plotly Figure with price and tweet traces.
-            - full_hovertemplate (str): The HTML string for unified hover styling.
+        tuple: A 2-element tuple containing:
+            - fig (dict): The main Plotly figure with price and tweet traces.
             - colors (list[str]): The qualitative color palette used for traces.
     """
-    fig = go.Figure()
-    fig.update_layout(
-        template="plotly_dark",
-        xaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
-        yaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
-        height=900,
-        font={"size": 18},
-        xaxis_title={"text": "Time", "font": {"size": 20}},
-        yaxis_title={"text": "USDT", "font": {"size": 20}},
-        legend={
-            "font": {"size": 16},
-            "orientation": "h",
-            "yanchor": "top",
-            "y": -0.2,
-            "xanchor": "center",
-            "x": 0.5,
-        },
-        hoverlabel={"font_size": 18},
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=coin_stock_df["created_at"],
-            y=coin_stock_df["open"],
-            name="Price (USD)",
-            yaxis="y1",
-            line={"color": "blue"},
-            zorder=10,
-        )
+    fig = {"data": [], "layout": dict(MAIN_FIGURE_LAYOUT)}
+    fig["data"].append(
+        {
+            "type": "scattergl",
+            **_price_trace_values(coin_stock_df),
+            "name": "Price (USD)",
+            "yaxis": "y",
+            "line": {"color": "blue"},
+        }
     )
 
     colors = px.colors.qualitative.Plotly
@@ -111,51 +231,59 @@ def _build_main_price_figure(
     y_min = coin_stock_df["open"].min()
     y_max = coin_stock_df["open"].max()
 
-    for i, (_, row) in enumerate(coin_tweet_df.iterrows()):
-
-        fig.add_trace(
-            go.Scatter(
-                x=[row["created_at"], row["created_at"]],
-                y=[y_min, y_max],
-                mode="lines",
-                name=str(row[POSTS_TEXT_COLUMN]),
-                line={"color": colors[i % len(colors)], "width": 1.5},
-                showlegend=True,
-                hoverinfo="skip",
-                zorder=1,
-            )
+    fig["data"].extend(
+        {
+            "type": "scatter",
+            "x": [created_at, created_at],
+            "y": [y_min, y_max],
+            "mode": "lines",
+            "name": str(tweet_text),
+            "line": {"color": color, "width": 1.5},
+            "showlegend": True,
+            "hoverinfo": "skip",
+            "zorder": 1,
+        }
+        for created_at, tweet_text, color in zip(
+            coin_tweet_df["created_at"], coin_tweet_df[POSTS_TEXT_COLUMN], cycle(colors)
         )
+    )
 
-    coin_tweet_df["timestamp"] = pd.to_datetime(coin_tweet_df["timestamp"], unit="s")
-
-    coin_tweet_df["date_display"] = coin_tweet_df["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S")
-
-    template_lines = [f"<b>{col}:</b> %{{customdata[{i}]}}" for i, col in enumerate(HOVER_COLUMNS)]
-    full_hovertemplate = "<br>".join(template_lines) + "<extra></extra>"
-
-    fig.add_trace(
-        go.Scatter(
-            x=coin_tweet_df["created_at"],
-            y=[coin_stock_df["open"].mean()] * len(coin_tweet_df),
-            mode="markers",
-            marker={
+    fig["data"].append(
+        {
+            "type": "scatter",
+            "x": coin_tweet_df["created_at"].dt.tz_localize(None).to_numpy(),
+            "y": _typed_array(np.full(len(coin_tweet_df), mean_price, dtype=np.float32)),
+            "mode": "markers",
+            "marker": {
                 "size": 15,
                 "color": "rgba(0,0,0,0)",
             },
-            text=coin_tweet_df[POSTS_TEXT_COLUMN],
-            customdata=coin_tweet_df[HOVER_COLUMNS],
-            hovertemplate=full_hovertemplate,
-            name="",
-            showlegend=True,
-        )
+            "text": coin_tweet_df[POSTS_TEXT_COLUMN].to_numpy(),
+            "customdata": coin_tweet_df[HOVER_COLUMNS].to_numpy(),
+            "hovertemplate": FULL_HOVERTEMPLATE,
+            "name": "",
+            "showlegend": True,
+        }
     )
 
-    fig.update_layout(
-        template="plotly_dark",
-        hovermode="x unified",
-    )
+    return fig, colors
+
+
+def _serialize_figure(fig: dict) -> dict:
+    """
+    Converts a Plotly figure into a plain, JSON-compatible dictionary.
+
+    Dash accepts figure dictionaries directly, and dictionaries made only of
+    built-in types are much cheaper to encode than a figure holding pandas
+    timestamps and NumPy arrays.
+
+    Args:
+        fig (dict): The figure to serialize.
 
-    return fig, full_hovertemplate, colors
+    Returns:
+        dict: The figure as parsed from its JSON representation.
+    """
+    return json.loads(pio.to_json(fig, validate=False))
 
 
 @callback(
@@ -167,8 +295,11 @@ def _build_main_price_figure(
     Input("date-from-picker", "value"),
     Input("date-to-picker", "value"),
     Input("text-filter-input", "value"),
+    State("price-volume-graph", "relayoutData"),
 )
-def update_dashboard(date_from: str, date_to: str, text_filter: str) -> tuple[go.Figure, go.Figure, str, str, str]:
+def update_dashboard(
+    date_from: str, date_to: str, text_filter: str, relayout_data: dict | None = None
+) -> tuple[go.Figure | dict, go.Figure | dict, str, str, str]:
     """
     Updates the dashboard visualizations and KPIs based on user-selected
     filters for dates and tweet content.
@@ -177,14 +308,20 @@ def update_dashboard(date_from: str, date_to: str, text_filter: str) -> tuple[go
         date_from (str): The start date string from the date picker (ISO format).
         date_to (str): The end date string from the date picker (ISO format).
         text_filter (str): Text query to filter tweets by their content.
+        relayout_data (dict | None): The price figure's last relayout event.
+            A text filter change keeps the zoom, so the price line is then
+            re-sampled for the zoomed range.
 
     Returns:
         tuple: A 5-element tuple containing:
-            - fig (go.Figure): The price-volume Scatter plot with tweet markers.
-            - impact_fig (go.Figure): The relative time impact analysis figure.
+            - fig (go.Figure | dict): The price-volume Scatter plot with tweet
+              markers, as a serialized figure dictionary once dates are set.
+            - impact_fig (go.Figure | dict): The relative time impact analysis figure.
             - total_tweets_kpi (str): Formatted string of total filtered tweets.
             - avg_price_kpi (str): Formatted string of the mean stock price.
             - impact_kpi (str): Formatted string of avg price at tweet timestamps.
+            The average price only depends on the dates, so it is returned as
+            ``no_update`` when only the text filter changed.
     """
 
     if date_from is None or date_to is None:
@@ -199,15 +336,108 @@ def update_dashboard(date_from: str, date_to: str, text_filter: str) -> tuple[go
     date_from_timestamp = formatters.convert_date_to_timestamp(date_from)
     date_to_timestamp = formatters.convert_date_to_timestamp(date_to)
 
-    coin_stock_df = STOCK_DATA
-    coin_tweet_df = TWEET_DATA
+    outputs = _compute_dashboard(date_from_timestamp, date_to_timestamp, text_filter)
+
+    if ctx.triggered_id == "text-filter-input":
+        zoomed_range = _relayout_time_range(relayout_data)
+        if zoomed_range is not None:
+            fig = outputs[0]
+            start = max(zoomed_range[0], date_from_timestamp)
+            end = min(zoomed_range[1], date_to_timestamp)
+            price_trace = {**fig["data"][0], **_price_trace_for_range(start, end)}
+            outputs = ({**fig, "data": [price_trace, *fig["data"][1:]]},) + outputs[1:]
+
+        return outputs[:3] + (no_update,) + outputs[4:]
+
+    return outputs
 
-    coin_stock_df = coin_stock_df[
-        (coin_stock_df["timestamp"] >= date_from_timestamp) & (coin_stock_df["timestamp"] <= date_to_timestamp)
-    ]
-    coin_tweet_df = coin_tweet_df[
-        (coin_tweet_df["timestamp"] >= date_from_timestamp) & (coin_tweet_df["timestamp"] <= date_to_timestamp)
-    ]
+
+@callback(
+    Output("price-volume-graph", "figure", allow_duplicate=True),
+    Input("price-volume-graph", "relayoutData"),
+    State("date-from-picker", "value"),
+    State("date-to-picker", "value"),
+    prevent_initial_call=True,
+)
+def update_price_resolution(relayout_data: dict | None, date_from: str, date_to: str) -> Patch:
+    """
+    Re-samples the price line for the visible time range after zooming or panning.
+
+    The initial figure reduces long ranges to PRICE_FIGURE_MAX_POINTS points,
+    which hides the intraday path around individual tweets. When the x-axis
+    is zoomed, only the price trace is replaced, with the data of the visible
+    range (reduced again only if it is still too long). Resetting the axes
+    restores the reduced full range.
+
+    Args:
+        relayout_data (dict | None): The price figure's relayout event.
+        date_from (str): The start date string from the date picker.
+        date_to (str): The end date string from the date picker.
+
+    Returns:
+        Patch: A partial figure update of the price trace, or ``no_update`` if
+            the event does not change the x-axis range.
+    """
+    if date_from is None or date_to is None or not relayout_data:
+        return no_update
+
+    date_from_timestamp = formatters.convert_date_to_timestamp(date_from)
+    date_to_timestamp = formatters.convert_date_to_timestamp(date_to)
+
+    if relayout_data.get("xaxis.autorange"):
+        start, end = date_from_timestamp, date_to_timestamp
+    else:
+        zoomed_range = _relayout_time_range(relayout_data)
+        if zoomed_range is None:
+            return no_update
+        start = max(zoomed_range[0], date_from_timestamp)
+        end = min(zoomed_range[1], date_to_timestamp)
+
+    price_trace = _price_trace_for_range(start, end)
+
+    patch = Patch()
+    patch["data"][0]["x"] = price_trace["x"]
+    patch["data"][0]["y"] = price_trace["y"]
+
+    return patch
+
+
+@lru_cache(maxsize=DASHBOARD_CACHE_SIZE)
+def _compute_dashboard(
+    date_from_timestamp: int, date_to_timestamp: int, text_filter: str | None
+) -> tuple[dict, dict, str, str, str]:
+    """
+    Filters the data and builds the dashboard figures and KPIs for one filter state.
+
+    The result depends only on the arguments and the read-only shared
+    datasets from ``datastore``, so it is memoized. Revisiting a previously
+    seen combination of dates and text filter returns the cached figures
+    without re-filtering.
+    Figures are cached in their serialized form, so cache hits also skip the
+    costly conversion of datetime and NumPy values to JSON.
+    Both figures carry the date range as their ``uirevision``, so zoom and
+    pan survive text filter changes and are reset when the dates change.
+
+    Args:
+        date_from_timestamp (int): Unix timestamp of the range start.
+        date_to_timestamp (int): Unix timestamp of the range end.
+        text_filter (str | None): Text query to filter tweets by their content.
+
+    Returns:
+        tuple: The same 5-element tuple as returned by update_dashboard.
+    """
+    coin_stock_df = processing.select_time_range(
+        datastore.get_stock_data(),
+        datastore.get_stock_timestamps(),
+        date_from_timestamp,
+        date_to_timestamp,
+    )
+    coin_tweet_df = processing.select_time_range(
+        datastore.get_tweet_data(),
+        datastore.get_tweet_timestamps(),
+        date_from_timestamp,
+        date_to_timestamp,
+    )
 
     coin_tweet_df = processing.filter_tweets_by_keyword(coin_tweet_df, text_filter)
 
@@ -215,24 +445,30 @@ def update_dashboard(date_from: str, date_to: str, text_filter: str) -> tuple[go
         ~coin_tweet_df["is_retweet"] & ~coin_tweet_df["is_quote"] & ~coin_tweet_df["is_reply"]
     ]
 
-    fig, full_hovertemplate, colors = _build_main_price_figure(coin_stock_df, coin_tweet_df)
+    mean_price = coin_stock_df["open"].mean()
+
+    fig, colors = _build_main_price_figure(coin_stock_df, coin_tweet_df, mean_price)
 
-    kpi_price = f"{coin_stock_df['open'].mean():,.4f}" if not coin_stock_df.empty else "N/A"
+    kpi_price = f"{mean_price:,.4f}" if not coin_stock_df.empty else "N/A"
 
-    impact_fig, _ = create_tweet_impact_figure(coin_tweet_df, coin_stock_df, full_hovertemplate, colors)
+    impact_fig, _ = create_tweet_impact_figure(coin_tweet_df, coin_stock_df, FULL_HOVERTEMPLATE, colors)
 
     avg_price_during_tweet = processing.calculate_avg_price_at_tweet_time(coin_tweet_df, coin_stock_df)
 
+    ui_revision = f"{date_from_timestamp}-{date_to_timestamp}"
+    fig["layout"]["uirevision"] = ui_revision
+    impact_fig["layout"]["uirevision"] = ui_revision
+
     return (
-        fig,
-        impact_fig,
+        _serialize_figure(fig),
+        _serialize_figure(impact_fig),
         f"{len(coin_tweet_df):,}",
         kpi_price,
         f"{avg_price_during_tweet:.4f}",
     )
 
 
-def _add_average_trend(impact_fig: go.Figure, all_normalized_series: list[pd.DataFrame]) -> None:
+def _add_average_trend(impact_fig: dict, relative_hours: np.ndarray, normalized_prices: np.ndarray) -> None:
     """
     Calculates and plots the aggregate average price trend across all tweet events.
 
@@ -241,138 +477,179 @@ def _add_average_trend(impact_fig: go.Figure, all_normalized_series: list[pd.Dat
     line and peak annotation to the impact figure.
 
     Args:
-        impact_fig (go.Figure): The Plotly figure object to which the average
+        impact_fig (dict): The Plotly figure dictionary to which the average
             trend trace will be added.
-        all_normalized_series (list[pd.DataFrame]): A list of DataFrames, where
-            each contains 'relative_hours' and 'normalized_price' for a single
-            tweet event.
+        relative_hours (np.ndarray): Concatenated hours relative to each tweet,
+            as returned by ``processing.compute_tweet_impacts``.
+        normalized_prices (np.ndarray): Concatenated normalized prices aligned
+            with relative_hours.
 
     Returns:
-        None: The function modifies the impact_fig object in-place.
+        None: The function modifies the impact_fig dictionary in-place.
     """
-    if all_normalized_series:
-        agg_df = pd.concat(all_normalized_series)
-        agg_df["relative_hours"] = agg_df["relative_hours"].round(4)
-        mean_impact = agg_df.groupby("relative_hours")["normalized_price"].mean().reset_index()
-
-        agg_post_tweet = mean_impact[mean_impact["relative_hours"] > 0]
-        if not agg_post_tweet.empty:
-            agg_max_val = agg_post_tweet["normalized_price"].max()
-            agg_peak_x = agg_post_tweet.loc[agg_post_tweet["normalized_price"].idxmax(), "relative_hours"]
-
-            impact_fig.add_trace(
-                go.Scatter(
-                    x=mean_impact["relative_hours"],
-                    y=mean_impact["normalized_price"],
-                    mode="lines",
-                    name="AVERAGE IMPACT",
-                    line={"color": "white", "width": 3},
-                    opacity=1.0,
-                    hovertemplate=(
-                        "<b>AVERAGE TREND</b><br>"
-                        + "Rel. Time: %{x:.2f}h<br>"
-                        + "Avg Change: %{y:.4f}x<br>"
-                        + "<extra></extra>"
-                    ),
-                )
-            )
-
-            impact_fig.add_vline(
-                x=agg_peak_x,
-                line_dash="dash",
-                line_width=3,
-                line_color="white",
-                annotation_text=f"AVG PEAK: {agg_max_val:.3f}x",
-                annotation_position="top right",
-            )
-
-
-def _process_single_tweet(
-    tweet: pd.Series,
-    stock_data_full: pd.DataFrame,
-    color: str,
-    impact_fig: go.Figure,
-    full_hovertemplate: str,
-) -> tuple[pd.DataFrame | None, tuple[float, float] | None]:
+    mean_hours, mean_prices = processing.average_by_relative_time(relative_hours, normalized_prices)
+
+    post_tweet = mean_hours > 0
+    if post_tweet.any():
+        post_peak = np.argmax(mean_prices[post_tweet])
+        agg_max_val = mean_prices[post_tweet][post_peak]
+        agg_peak_x = mean_hours[post_tweet][post_peak]
+
+        impact_fig["data"].append(
+            {
+                "type": "scatter",
+                "x": _typed_array(mean_hours),
+                "y": _typed_array(mean_prices),
+                "mode": "lines",
+                "name": "AVERAGE IMPACT",
+                "line": {"color": "white", "width": 3},
+                "opacity": 1.0,
+                "hovertemplate": (
+                    "<b>AVERAGE TREND</b><br>"
+                    + "Rel. Time: %{x:.2f}h<br>"
+                    + "Avg Change: %{y:.4f}x<br>"
+                    + "<extra></extra>"
+                ),
+            }
+        )
+
+        impact_fig["layout"]["shapes"] = [
+            {
+                "type": "line",
+                "xref": "x",
+                "x0": agg_peak_x,
+                "x1": agg_peak_x,
+                "yref": "y domain",
+                "y0": 0,
+                "y1": 1,
+                "line": {"color": "white", "width": 3, "dash": "dash"},
+            }
+        ]
+        impact_fig["layout"]["annotations"] = [
+            {
+                "text": f"AVG PEAK: {agg_max_val:.3f}x",
+                "showarrow": False,
+                "xref": "x",
+                "x": agg_peak_x,
+                "xanchor": "left",
+                "yref": "y domain",
+                "y": 1,
+                "yanchor": "top",
+            }
+        ]
+
+
+def _add_peak_markers(
+    relative_hours: np.ndarray,
+    normalized_prices: np.ndarray,
+    peak_indices: np.ndarray,
+    colors: list[str],
+    impact_fig: dict,
+) -> None:
     """
-    Computes and plots the normalized price impact for a single tweet event.
+    Marks each tweet's post-event price peak with a dotted vertical line.
 
-    This helper function extracts a relative time window around the tweet's
-    creation time, normalizes asset prices to the price at tweet-time,
-    plots the resulting price trajectory on the provided Plotly figure,
-    and identifies the peak post-tweet price movement.
+    The lines of all tweets sharing a palette color are drawn as one trace of
+    NaN-separated segments spanning the plotted price range, instead of one
+    layout shape per tweet.
 
     Args:
-        tweet (pd.Series): A single row from the tweet DataFrame containing
-            tweet metadata, including the 'created_at' timestamp.
-        stock_data_full (pd.DataFrame): Full historical price data with
-            'timestamp' and 'open' price columns.
-        color (str): Color used for the tweet's price trajectory and
-            associated annotations.
-        impact_fig (go.Figure): Plotly figure to which the tweet impact
-            trace and peak marker will be added.
-        full_hovertemplate (str): HTML hover template used to render
-            detailed tweet metadata on hover.
-
-    Returns:
-        tuple: A 2-element tuple containing:
-            - pd.DataFrame | None: DataFrame with 'relative_hours' and
-              'normalized_price' for the tweet window, or None if no
-              valid price data was available.
-            - tuple[float, float] | None: A tuple of (peak_price, peak_hour)
-              for the post-tweet window, or None if no post-event peak exists.
+        relative_hours (np.ndarray): Concatenated hours relative to each tweet.
+        normalized_prices (np.ndarray): Concatenated normalized prices.
+        peak_indices (np.ndarray): Per-tweet index of the peak within the
+            arrays above, or -1 if the tweet has no post-event peak.
+        colors (list[str]): Palette cycled through by tweet position.
+        impact_fig (dict): Plotly figure dictionary to which the markers are added.
     """
-    t_time = tweet["created_at"].floor("min").timestamp()
-
-    window_df = stock_data_full[
-        (stock_data_full["timestamp"] >= t_time - RELATIVE_TIME_SPREAD_HOURS)
-        & (stock_data_full["timestamp"] <= t_time + RELATIVE_TIME_SPREAD_HOURS)
-    ].copy()
-
-    if window_df.empty:
-        return None, None
-
-    tweet_price_row = window_df[window_df["timestamp"] == t_time]
-    if tweet_price_row.empty:
-        tweet_price_row = window_df.iloc[(window_df["timestamp"] - t_time).abs().argsort()[:1]]
-
-    price_at_tweet = tweet_price_row["open"].iloc[0]
-    window_df["normalized_price"] = window_df["open"] / price_at_tweet
-    window_df["relative_hours"] = (window_df["timestamp"] - t_time) / 3600
-
-    positive_df = window_df[window_df["relative_hours"] > 0]
-    peak_info = None
-
-    if not positive_df.empty:
-        max_val = positive_df["normalized_price"].max()
-        peak_x = positive_df.loc[positive_df["normalized_price"].idxmax(), "relative_hours"]
-
-        impact_fig.add_vline(
-            x=peak_x,
-            line_dash="dot",
-            line_width=1,
-            line_color=color,
-            opacity=1,
+    if not len(normalized_prices):
+        return
+
+    y_segment = [normalized_prices.min(), normalized_prices.max(), np.nan]
+
+    for color_index, color in enumerate(colors):
+        group_peaks = peak_indices[color_index :: len(colors)]
+        group_peaks = group_peaks[group_peaks >= 0]
+        if not len(group_peaks):
+            continue
+
+        x_values = np.repeat(relative_hours[group_peaks], 3)
+        x_values[2::3] = np.nan
+
+        impact_fig["data"].append(
+            {
+                "type": "scattergl",
+                "x": _typed_array(x_values),
+                "y": _typed_array(np.tile(y_segment, len(group_peaks))),
+                "mode": "lines",
+                "line": {"color": color, "width": 1, "dash": "dot"},
+                "hoverinfo": "skip",
+                "showlegend": False,
+            }
         )
 
-        peak_info = (max_val, peak_x)
 
-    customdata = [tweet[HOVER_COLUMNS].values] * len(window_df)
+def _add_tweet_impact_traces(
+    relative_hours: np.ndarray,
+    normalized_prices: np.ndarray,
+    offsets: np.ndarray,
+    hover_rows: np.ndarray,
+    colors: list[str],
+    impact_fig: dict,
+    full_hovertemplate: str,
+) -> None:
+    """
+    Plots the normalized price trajectories of all tweet events.
 
-    impact_fig.add_trace(
-        go.Scatter(
-            x=window_df["relative_hours"],
-            y=window_df["normalized_price"],
-            mode="lines",
-            name=f"{tweet['full_text']}",
-            line={"color": color, "width": 1.5},
-            opacity=1.0,
-            customdata=customdata,
-            hovertemplate=full_hovertemplate,
-        )
-    )
+    Tweets sharing a palette color are drawn as one WebGL trace whose windows
+    are separated by NaN points, so the number of traces is bounded by the
+    palette size instead of growing with the number of tweets. All traces
+    belong to one legend group and are toggled together.
 
-    return window_df[["relative_hours", "normalized_price"]], peak_info
+    Args:
+        relative_hours (np.ndarray): Concatenated hours relative to each tweet,
+            as returned by ``processing.compute_tweet_impacts``.
+        normalized_prices (np.ndarray): Concatenated normalized prices.
+        offsets (np.ndarray): Per-tweet slice offsets into the arrays above.
+        hover_rows (np.ndarray): The tweets' values for HOVER_COLUMNS, one row
+            per tweet.
+        colors (list[str]): Palette cycled through by tweet position.
+        impact_fig (dict): Plotly figure dictionary to which the traces are added.
+        full_hovertemplate (str): HTML hover template used to render
+            detailed tweet metadata on hover.
+    """
+    x_values = np.append(relative_hours, np.nan)
+    y_values = np.append(normalized_prices, np.nan)
+    point_tweets = np.append(np.repeat(np.arange(len(hover_rows)), np.diff(offsets)), -1)
+    hover_values = np.vstack([hover_rows, np.full((1, hover_rows.shape[1]), None, dtype=object)])
+
+    first_trace = True
+    for color_index, color in enumerate(colors):
+        segments = [
+            np.append(np.arange(offsets[i], offsets[i + 1]), -1)
+            for i in range(color_index, len(hover_rows), len(colors))
+            if offsets[i] < offsets[i + 1]
+        ]
+        if not segments:
+            continue
+
+        points = np.concatenate(segments)[:-1]
+
+        impact_fig["data"].append(
+            {
+                "type": "scattergl",
+                "x": _typed_array(x_values[points]),
+                "y": _typed_array(y_values[points]),
+                "mode": "lines",
+                "name": "Tweet impact",
+                "legendgroup": "tweet-impact",
+                "showlegend": first_trace,
+                "line": {"color": color, "width": 1.5},
+                "opacity": 1.0,
+                "customdata": hover_values[point_tweets[points]],
+                "hovertemplate": full_hovertemplate,
+            }
+        )
+        first_trace = False
 
 
 def create_tweet_impact_figure(
@@ -380,7 +657,7 @@ def create_tweet_impact_figure(
     stock_data_full: pd.DataFrame,
     full_hovertemplate: str,
     colors: list[str],
-) -> tuple[go.Figure, list[tuple[float, float]]]:
+) -> tuple[dict, list[tuple[float, float]]]:
     """
     Creates a Plotly figure showing the normalized price impact of tweets
     over a relative time window.
@@ -392,9 +669,10 @@ def create_tweet_impact_figure(
 
     Args:
         coin_tweet_df (pd.DataFrame): DataFrame containing filtered tweet data
-            with 'created_at' and 'timestamp' columns.
+            with 'created_at', 'timestamp' and TWEET_MINUTE_TIMESTAMP_COLUMN
+            columns.
         stock_data_full (pd.DataFrame): The complete historical stock price
-            DataFrame with 'timestamp' and 'open' columns.
+            DataFrame with 'timestamp' and 'open' columns, sorted by timestamp.
         full_hovertemplate (str): A string defining the HTML layout for the
             Plotly hover labels.
         colors (list[str]): A list of color hex codes or names to cycle through
@@ -402,56 +680,45 @@ def create_tweet_impact_figure(
 
     Returns:
         tuple: A 2-element tuple containing:
-            - impact_fig (go.Figure): The generated Plotly figure showing
+            - impact_fig (dict): The generated Plotly figure dictionary showing
               normalized price trajectories.
             - max_vals (list[tuple[float, float]]): A list of tuples containing
               (peak_price, peak_hour) for each tweet's post-event window.
     """
-    impact_fig = go.Figure()
-    impact_fig.update_layout(
-        title={
-            "text": "Price Impact: 6 hours Before vs 6 hours after Tweets",
-            "font": {"size": 24},
-        },
-        template="plotly_dark",
-        xaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
-        yaxis={"showgrid": True, "gridwidth": 1, "gridcolor": "LightGrey"},
-        xaxis_title={"text": "Hours relative to Tweet", "font": {"size": 20}},
-        yaxis_title={"text": "Normalized Price", "font": {"size": 20}},
-        hovermode="closest",
-        height=900,
-        font={"size": 18},
-        legend={
-            "font": {"size": 16},
-            "orientation": "v",
-            "yanchor": "top",
-            "y": -0.2,
-            "xanchor": "center",
-            "x": 0.5,
-        },
-    )
+    impact_fig = {"data": [], "layout": dict(IMPACT_FIGURE_LAYOUT)}
 
-    max_vals: list[tuple[float, float]] = []
-    all_normalized_series: list[pd.DataFrame] = []
+    stock_timestamps = stock_data_full["timestamp"].to_numpy(dtype=np.int64)
+    stock_prices = stock_data_full["open"].to_numpy(dtype=np.float64)
 
-    for i, (_, tweet) in enumerate(coin_tweet_df.iterrows()):
-        color = colors[i % len(colors)]
+    tweet_times = coin_tweet_df[TWEET_MINUTE_TIMESTAMP_COLUMN].to_numpy(dtype=np.int64)
+    hover_rows = coin_tweet_df[HOVER_COLUMNS].to_numpy()
 
-        series_df, peak_info = _process_single_tweet(
-            tweet=tweet,
-            stock_data_full=stock_data_full,
-            color=color,
-            impact_fig=impact_fig,
-            full_hovertemplate=full_hovertemplate,
-        )
+    relative_hours, normalized_prices, offsets, peak_indices = processing.compute_tweet_impacts(
+        stock_timestamps, stock_prices, tweet_times, RELATIVE_TIME_SPREAD_HOURS
+    )
+
+    _add_tweet_impact_traces(
+        relative_hours=relative_hours,
+        normalized_prices=normalized_prices,
+        offsets=offsets,
+        hover_rows=hover_rows,
+        colors=colors,
+        impact_fig=impact_fig,
+        full_hovertemplate=full_hovertemplate,
+    )
 
-        if series_df is not None:
-            all_normalized_series.append(series_df)
+    peaks = peak_indices[peak_indices >= 0]
+    max_vals = list(zip(normalized_prices[peaks], relative_hours[peaks]))
 
-        if peak_info is not None:
-            max_vals.append(peak_info)
+    _add_peak_markers(
+        relative_hours=relative_hours,
+        normalized_prices=normalized_prices,
+        peak_indices=peak_indices,
+        colors=colors,
+        impact_fig=impact_fig,
+    )
 
-    _add_average_trend(impact_fig, all_normalized_series)
+    _add_average_trend(impact_fig, relative_hours, normalized_prices)
 
     return impact_fig, max_vals
 
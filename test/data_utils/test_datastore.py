@@ -0,0 +1,131 @@
+"""
+Unit tests for the shared dataset accessors.
+
+This module verifies that the price and tweet datasets are loaded, prepared
+and sorted on first access, and that later calls reuse the same DataFrame
+instead of reading the files again.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import config
+from src.data_utils import datastore, loaders
+
+
+class TestDatastore:
+    """
+    Test suite for get_stock_data and get_tweet_data.
+
+    The configured dataset paths are redirected to small temporary CSV files
+    and the accessor caches are cleared around every test.
+    """
+
+    @pytest.fixture(autouse=True)
+    def datasets(self, tmp_path, monkeypatch):
+        """Writes temporary datasets and points the config at them."""
+        pd.DataFrame(
+            {
+                "timestamp": [120, 60],
+                "open": [2.0, 1.0],
+                "close": [2.5, 1.5],
+            }
+        ).to_csv(tmp_path / "prices.csv", index=False)
+
+        tweets = pd.DataFrame(
+            {column: ["0", "0"] for column in config.PROCESSED_POSTS_DTYPES}
+        )
+        tweets["created_at"] = [
+            "2024-01-02 00:00:59+00:00",
+            "2024-01-01 00:00:00+00:00",
+        ]
+        tweets[config.POSTS_TEXT_COLUMN] = ["second", "first"]
+        tweets["quote_id"] = [1.3592223456789123e18, np.nan]
+        tweets["in_reply_to_user_id"] = [1659576000.0, np.nan]
+        tweets.to_csv(tmp_path / "tweets.csv", index=False)
+
+        monkeypatch.setattr(config, "PROCESSED_DIR", [str(tmp_path)])
+        monkeypatch.setattr(
+            config, "PROCESSED_DOGE_PRICE_PATH", "prices.csv"
+        )
+        monkeypatch.setattr(
+            config,
+            "DOGE_DTYPES",
+            {"timestamp": "Int64", "open": "float64", "close": "float64"},
+        )
+        monkeypatch.setattr(
+            config, "PROCESSED_TWEETS_DOGECOIN_PATH", "tweets.csv"
+        )
+
+        self.clear_caches()
+        yield
+        self.clear_caches()
+
+    @staticmethod
+    def clear_caches():
+        """Resets every cached accessor of the datastore."""
+        datastore.get_stock_data.cache_clear()
+        datastore.get_tweet_data.cache_clear()
+        datastore.get_stock_timestamps.cache_clear()
+        datastore.get_tweet_timestamps.cache_clear()
+
+    def test_get_stock_data_prepared(self):
+        """Tests column selection, datetime conversion and sorting."""
+        df = datastore.get_stock_data()
+
+        assert list(df["timestamp"]) == [60, 120]
+        assert "close" not in df.columns
+        assert str(df["created_at"].dt.tz) == "UTC"
+
+    def test_get_tweet_data_prepared(self):
+        """Tests timestamp conversion, string dtype and sorting."""
+        df = datastore.get_tweet_data()
+
+        assert list(df[config.POSTS_TEXT_COLUMN]) == ["first", "second"]
+        assert df[config.POSTS_TEXT_COLUMN].dtype == "string[pyarrow]"
+        assert df["quote_id"].dtype == "Int64"
+        assert list(df["in_reply_to_user_id"].fillna(0)) == [0, 1659576000]
+        assert list(df["timestamp"]) == [1704067200, 1704153659]
+        assert list(df["date_display"]) == [
+            "2024-01-01 00:00:00",
+            "2024-01-02 00:00:59",
+        ]
+        assert list(df[config.TWEET_MINUTE_TIMESTAMP_COLUMN]) == [
+            1704067200,
+            1704153600,
+        ]
+
+    def test_get_tweet_data_dtypes_kept_by_cache(self):
+        """Tests that a reload from the Parquet cache keeps every dtype."""
+        first = datastore.get_tweet_data()
+        self.clear_caches()
+        second = datastore.get_tweet_data()
+
+        pd.testing.assert_series_equal(first.dtypes, second.dtypes)
+
+    def test_timestamps_aligned_with_data(self):
+        """Tests that the timestamp arrays are sorted int64 copies."""
+        stock_timestamps = datastore.get_stock_timestamps()
+        tweet_timestamps = datastore.get_tweet_timestamps()
+
+        assert stock_timestamps.dtype == np.int64
+        assert list(stock_timestamps) == [60, 120]
+        assert list(tweet_timestamps) == list(
+            datastore.get_tweet_data()["timestamp"]
+        )
+
+    def test_datasets_loaded_once(self, monkeypatch):
+        """Tests that repeated calls return the same DataFrame."""
+        calls = []
+        original = loaders.load_data
+
+        def counting_load_data(*args, **kwargs):
+            calls.append(args[1])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(loaders, "load_data", counting_load_data)
+
+        assert datastore.get_stock_data() is datastore.get_stock_data()
+        assert datastore.get_tweet_data() is datastore.get_tweet_data()
+        assert calls == ["prices.csv", "tweets.csv"]
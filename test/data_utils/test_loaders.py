@@ -10,7 +10,9 @@ directory structures.
 
 import os
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from src.data_utils.loaders import load_data, save_data
@@ -81,6 +83,95 @@ class TestLoadData:
         assert df["id"].dtype == "int"
         assert df["val"].dtype == "float"
 
+    @pytest.mark.parametrize(
+        "mock_csv",
+        [("nullable.csv", "1000000000000000001,x\n,\n")],
+        indirect=True,
+    )
+    def test_load_data_with_nullable_types(self, mock_csv):
+        """
+        Verifies that empty cells become missing values and that large
+        nullable integers are loaded exactly.
+        """
+        directory, filename = mock_csv
+        types = {"id": "Int64", "label": "string"}
+
+        df = load_data(directory, filename, types=types)
+
+        assert df["id"].iloc[0] == 1000000000000000001
+        assert df["id"].isna().iloc[1]
+        assert df["label"].isna().iloc[1]
+        assert df["label"].dtype == "string"
+
+    def test_load_data_with_float_formatted_integers(self, tmp_path):
+        """
+        Verifies that integer columns accept float-formatted cells, as
+        written by pandas for integer columns with missing values.
+        """
+        pd.DataFrame(
+            {
+                "quote_id": [1.3592223456789123e18, np.nan],
+                "count": [1659576000.0, 3.0],
+            }
+        ).to_csv(tmp_path / "ids.csv", index=False)
+        types = {"quote_id": "Int64", "count": "int64"}
+
+        df = load_data([str(tmp_path)], "ids.csv", types=types, skiprows=1)
+
+        assert df["quote_id"].iloc[0] == int(1.3592223456789123e18)
+        assert df["quote_id"].isna().iloc[1]
+        assert list(df["count"]) == [1659576000, 3]
+        assert df["count"].dtype == "int64"
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("fraction.csv", "1.5\n")], indirect=True
+    )
+    def test_load_data_integer_with_fraction_fails(self, mock_csv):
+        """Negative test: Verifies that fractional integers are rejected."""
+        directory, filename = mock_csv
+
+        with pytest.raises(pa.ArrowInvalid):
+            load_data(directory, filename, types={"id": "Int64"})
+
+    def test_load_data_with_multiline_quoted_values(self, tmp_path):
+        """
+        Verifies that quoted values spanning several lines stay in one row,
+        also in files larger than one read block, and that empty strings
+        become missing values, as with pd.read_csv.
+        """
+        rows = 50_000
+        expected = pd.DataFrame(
+            {
+                "id": range(rows),
+                "text": ["tweet text\nwith a second line"] * rows,
+            }
+        ).astype({"text": "string[pyarrow]"})
+        expected.loc[1, "text"] = pd.NA
+        expected.to_csv(tmp_path / "multiline.csv", index=False)
+        types = {"id": "int64", "text": "string[pyarrow]"}
+
+        df = load_data(
+            [str(tmp_path)], "multiline.csv", types=types, skiprows=1
+        )
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    @pytest.mark.parametrize(
+        "mock_csv",
+        [("dates.csv", "2024-01-01 02:00:00+02:00\n2024-01-01T00:00:00Z")],
+        indirect=True,
+    )
+    def test_load_data_with_utc_datetime_type(self, mock_csv):
+        """Verifies that offset timestamps are parsed and converted to UTC."""
+        directory, filename = mock_csv
+
+        df = load_data(
+            directory, filename, types={"created_at": "datetime64[ns, UTC]"}
+        )
+
+        assert df["created_at"].dtype == "datetime64[ns, UTC]"
+        assert (df["created_at"] == pd.Timestamp("2024-01-01", tz="UTC")).all()
+
     @pytest.mark.parametrize(
         "wrong_dir, wrong_file",
         [(["non", "existent"], "data.csv"), (["data"], "missing.csv")],
@@ -114,6 +205,169 @@ class TestLoadData:
         assert list(df.columns) == ["col1", "col2"]
         assert len(df) == 1
 
+    @pytest.mark.parametrize(
+        "mock_csv", [("columns.csv", "1;10.5;x\n2;20.5;y")], indirect=True
+    )
+    def test_load_data_selected_columns(self, mock_csv):
+        """Tests that only the requested columns are kept, in the given order."""
+        directory, filename = mock_csv
+        types = {"id": "int64", "val": "float64", "label": "string"}
+
+        df = load_data(
+            directory,
+            filename,
+            separator=";",
+            types=types,
+            columns=["val", "id"],
+        )
+
+        assert list(df.columns) == ["val", "id"]
+        assert df["val"].dtype == "float64"
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("subset.csv", "a,b,c\n1,2,3\n4,5,6")], indirect=True
+    )
+    def test_load_data_selected_columns_with_cache(self, mock_csv):
+        """Tests that the Parquet cache keeps all columns for later selections."""
+        directory, filename = mock_csv
+
+        first = load_data(
+            directory, filename, parquet_cache=True, columns=["a"]
+        )
+        second = load_data(
+            directory, filename, parquet_cache=True, columns=["c", "b"]
+        )
+
+        assert list(first.columns) == ["a"]
+        assert list(second.columns) == ["c", "b"]
+        assert list(second["c"]) == [3, 6]
+
+    def test_load_data_parquet_file(self, tmp_path):
+        """Tests that files with a '.parquet' extension are read as Parquet."""
+        expected = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        expected.to_parquet(tmp_path / "table.parquet", index=False)
+
+        df = load_data([str(tmp_path)], "table.parquet")
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("cached.csv", "a,b\n1,2\n3,4")], indirect=True
+    )
+    def test_load_data_parquet_cache_created(self, mock_csv):
+        """Tests that enabling the cache writes a Parquet copy of the CSV."""
+        directory, filename = mock_csv
+
+        df = load_data(directory, filename, parquet_cache=True)
+
+        cache_path = os.path.join(*directory, filename + ".parquet")
+        assert os.path.exists(cache_path)
+        pd.testing.assert_frame_equal(pd.read_parquet(cache_path), df)
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("reuse.csv", "a,b\n1,2\n3,4")], indirect=True
+    )
+    def test_load_data_parquet_cache_reused(self, mock_csv):
+        """Tests that a fresh Parquet cache is read instead of the CSV."""
+        directory, filename = mock_csv
+        csv_path = os.path.join(*directory, filename)
+        first = load_data(directory, filename, parquet_cache=True)
+        cache_mtime = os.path.getmtime(csv_path + ".parquet")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n42,43")
+        os.utime(csv_path, (cache_mtime - 10, cache_mtime - 10))
+
+        df = load_data(directory, filename, parquet_cache=True)
+
+        pd.testing.assert_frame_equal(df, first)
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("legacy.csv", "a,b\n1,2\n3,4")], indirect=True
+    )
+    def test_load_data_parquet_cache_without_options_rebuilt(self, mock_csv):
+        """Tests that a cache without recorded options is rebuilt."""
+        directory, filename = mock_csv
+        cache_path = os.path.join(*directory, filename + ".parquet")
+        pd.DataFrame({"a": [42], "b": [43]}).to_parquet(cache_path)
+
+        df = load_data(directory, filename, parquet_cache=True)
+
+        assert list(df["a"]) == [1, 3]
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("options.csv", "1;2.5\n3;4.5")], indirect=True
+    )
+    def test_load_data_parquet_cache_rebuilt_for_new_options(self, mock_csv):
+        """Tests that changing the parsing options rebuilds the cache."""
+        directory, filename = mock_csv
+        load_data(
+            directory,
+            filename,
+            separator=";",
+            types={"id": "int64", "val": "float64"},
+            parquet_cache=True,
+        )
+
+        df = load_data(
+            directory,
+            filename,
+            separator=";",
+            types={"id": "Int32", "val": "float32"},
+            parquet_cache=True,
+        )
+        skipped = load_data(
+            directory,
+            filename,
+            separator=";",
+            types={"id": "Int32", "val": "float32"},
+            skiprows=1,
+            parquet_cache=True,
+        )
+
+        assert df["id"].dtype == "Int32"
+        assert df["val"].dtype == "float32"
+        assert list(skipped["id"]) == [3]
+
+    @pytest.mark.parametrize(
+        "mock_csv",
+        [("dtypes.csv", "1,x,True,2024-01-01T00:00:00Z\n")],
+        indirect=True,
+    )
+    def test_load_data_parquet_cache_keeps_dtypes(self, mock_csv):
+        """Tests that data read from the cache has the requested dtypes."""
+        directory, filename = mock_csv
+        types = {
+            "id": "Int64",
+            "text": "string[pyarrow]",
+            "flag": "bool[pyarrow]",
+            "created_at": "datetime64[ns, UTC]",
+        }
+
+        first = load_data(directory, filename, types=types, parquet_cache=True)
+        second = load_data(
+            directory, filename, types=types, parquet_cache=True
+        )
+
+        pd.testing.assert_series_equal(first.dtypes, second.dtypes)
+        assert second["text"].dtype == "string[pyarrow]"
+
+    @pytest.mark.parametrize(
+        "mock_csv", [("stale.csv", "a,b\n1,2\n3,4")], indirect=True
+    )
+    def test_load_data_parquet_cache_stale(self, mock_csv):
+        """Tests that a cache older than the CSV is rebuilt from the CSV."""
+        directory, filename = mock_csv
+        csv_path = os.path.join(*directory, filename)
+        cache_path = csv_path + ".parquet"
+        pd.DataFrame({"a": [42], "b": [43]}).to_parquet(cache_path)
+        csv_mtime = os.path.getmtime(csv_path)
+        os.utime(cache_path, (csv_mtime - 10, csv_mtime - 10))
+
+        df = load_data(directory, filename, parquet_cache=True)
+
+        assert list(df["a"]) == [1, 3]
+        pd.testing.assert_frame_equal(pd.read_parquet(cache_path), df)
+
 
 class TestSaveData:
     """
@@ -191,3 +445,13 @@ class TestSaveData:
         updated_df = pd.read_csv(os.path.join(str(tmp_path), filename))
         assert len(updated_df) == 2
         pd.testing.assert_frame_equal(updated_df, sample_df)
+
+    def test_save_data_parquet(self, tmp_path, sample_df):
+        """Verifies that a '.parquet' filename is written in Parquet format."""
+        directory_list = [str(tmp_path)]
+        filename = "scores.parquet"
+
+        save_data(directory_list, filename, sample_df)
+
+        reloaded_df = pd.read_parquet(os.path.join(str(tmp_path), filename))
+        pd.testing.assert_frame_equal(reloaded_df, sample_df)
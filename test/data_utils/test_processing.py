@@ -7,6 +7,7 @@ general text search, and the temporal alignment between social media events
 and financial market data.
 """
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -81,6 +82,15 @@ class TestDogecoinFiltering:
         assert len(result) == 0
         assert isinstance(result, pd.DataFrame)
 
+    def test_get_posts_related_to_dogecoin_literal_keywords(self):
+        """Ensures keywords are matched literally and missing text is skipped."""
+        df = pd.DataFrame({"text": ["Buy $DOGE now", "DOGE", np.nan, "a.b"]})
+        result = processing.get_posts_related_to_dogecoin(
+            df, doge_keywords=["$doge", "a.b"], text_column="text"
+        )
+
+        assert result["text"].tolist() == ["Buy $DOGE now", "a.b"]
+
     def test_get_repost_related_to_dogecoin_quote(self, sample_tweets_df):
         """Tests the logic for matching keywords across multiple text columns (quotes)."""
         keywords = ["Efficiency"]
@@ -181,6 +191,46 @@ class TestKeywordFiltering:
         assert len(result) == len(sample_tweet_df)
         pd.testing.assert_frame_equal(result, sample_tweet_df)
 
+    def test_filter_tweets_by_keyword_regex_pattern(self, sample_tweet_df):
+        """Tests that keywords containing regex syntax are still matched as regex."""
+        result = processing.filter_tweets_by_keyword(
+            sample_tweet_df, "py.*ing", text_column="text"
+        )
+
+        assert list(result["text"]) == ["Python is amazing!"]
+
+    def test_filter_tweets_by_keyword_arrow_strings(self, sample_tweet_df):
+        """Tests literal matching on an Arrow-backed string column."""
+        sample_tweet_df["text"] = sample_tweet_df["text"].astype(
+            "string[pyarrow]"
+        )
+
+        result = processing.filter_tweets_by_keyword(
+            sample_tweet_df, "PYTHON", text_column="text"
+        )
+
+        assert list(result["other_column"]) == ["a", "d"]
+
+    def test_filter_tweets_by_keyword_arrow_lookahead(self, sample_tweet_df):
+        """Tests that patterns RE2 rejects fall back to Python's re."""
+        sample_tweet_df["text"] = sample_tweet_df["text"].astype(
+            "string[pyarrow]"
+        )
+
+        result = processing.filter_tweets_by_keyword(
+            sample_tweet_df, "py.*(?=ing)", text_column="text"
+        )
+
+        assert list(result["other_column"]) == ["a"]
+
+    def test_filter_tweets_by_keyword_invalid_regex(self, sample_tweet_df):
+        """Tests that an invalid regular expression matches no rows."""
+        result = processing.filter_tweets_by_keyword(
+            sample_tweet_df, "python(", text_column="text"
+        )
+
+        assert len(result) == 0
+
     def test_filter_tweets_by_keyword_no_matches(self, sample_tweet_df):
         """Tests that it returns an empty DataFrame when the keyword is not found."""
         result = processing.filter_tweets_by_keyword(
@@ -294,3 +344,167 @@ class TestAveragePriceAtTweetTime:
             tweet_df, sample_stock_data
         )
         assert result == 100.0
+
+
+class TestSelectTimeRange:
+    """
+    Test suite for the binary-search based time range selection.
+
+    Validates that inclusive bounds are honoured on a sorted timestamp
+    column and that out-of-range queries return empty slices.
+    """
+
+    @pytest.fixture
+    def sorted_df(self):
+        """Provides a DataFrame sorted by its 'timestamp' column."""
+        return pd.DataFrame(
+            {
+                "timestamp": [100, 160, 220, 280, 340],
+                "open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            }
+        )
+
+    def test_select_time_range_inclusive_bounds(self, sorted_df):
+        """Tests that rows exactly on both bounds are kept."""
+        result = processing.select_time_range(
+            sorted_df, sorted_df["timestamp"].to_numpy(), 160, 280
+        )
+
+        assert list(result["timestamp"]) == [160, 220, 280]
+
+    def test_select_time_range_between_rows(self, sorted_df):
+        """Tests bounds that fall between existing timestamps."""
+        result = processing.select_time_range(
+            sorted_df, sorted_df["timestamp"].to_numpy(), 150, 300
+        )
+
+        assert list(result["open"]) == [2.0, 3.0, 4.0]
+
+    def test_select_time_range_no_rows(self, sorted_df):
+        """Tests that a range outside of the data returns an empty DataFrame."""
+        result = processing.select_time_range(
+            sorted_df, sorted_df["timestamp"].to_numpy(), 400, 500
+        )
+
+        assert result.empty
+        assert list(result.columns) == ["timestamp", "open"]
+
+
+class TestDownsampleMinMax:
+    """
+    Test suite for the min/max bucket decimation used before plotting.
+
+    Validates that short series are kept whole and that long series are
+    reduced without losing their extremes.
+    """
+
+    def test_downsample_min_max_short_series_unchanged(self):
+        """Tests that a series within the limit keeps every position."""
+        result = processing.downsample_min_max(np.array([3.0, 1.0, 2.0]), 4)
+
+        assert list(result) == [0, 1, 2]
+
+    def test_downsample_min_max_keeps_extremes(self):
+        """Tests the size limit, ordering and preserved spikes and dips."""
+        values = np.sin(np.linspace(0, 20, 1001))
+        values[137] = 5.0
+        values[802] = -5.0
+
+        result = processing.downsample_min_max(values, 100)
+
+        assert len(result) <= 100
+        assert np.all(np.diff(result) > 0)
+        assert 137 in result
+        assert 802 in result
+
+    def test_downsample_min_max_skips_missing_values(self):
+        """Tests that missing values are not picked as bucket extremes."""
+        values = np.array([np.nan, 1.0, np.nan, 2.0, 4.0, np.nan])
+
+        result = processing.downsample_min_max(values, 2)
+
+        assert list(result) == [1, 4]
+
+
+class TestComputeTweetImpacts:
+    """
+    Test suite for the batched tweet impact normalization.
+
+    Validates the window bounds, the pivot price used for normalization,
+    the concatenated offsets and the post-tweet peak lookup.
+    """
+
+    @pytest.fixture
+    def prices(self):
+        """Provides minute-spaced timestamps and their prices."""
+        timestamps = np.array([0, 60, 120, 180, 240, 300], dtype=np.int64)
+        opens = np.array([1.0, 2.0, 4.0, 8.0, 4.0, 8.0])
+        return timestamps, opens
+
+    def test_compute_tweet_impacts_normalizes_window(self, prices):
+        """Tests that prices are divided by the price at tweet time."""
+        hours, normalized, offsets, _ = processing.compute_tweet_impacts(
+            *prices, np.array([120]), 60
+        )
+
+        assert list(offsets) == [0, 3]
+        assert list(normalized) == [0.5, 1.0, 2.0]
+        assert list(hours) == [-60 / 3600, 0.0, 60 / 3600]
+
+    def test_compute_tweet_impacts_nearest_price_prefers_earlier(
+        self, prices
+    ):
+        """Tests that a tweet between two prices uses the earlier one."""
+        _, normalized, _, _ = processing.compute_tweet_impacts(
+            *prices, np.array([90]), 60
+        )
+
+        assert list(normalized) == [1.0, 2.0]
+
+    def test_compute_tweet_impacts_offsets_skip_empty_windows(self, prices):
+        """Tests that tweets without price data get an empty slice."""
+        _, normalized, offsets, peaks = processing.compute_tweet_impacts(
+            *prices, np.array([0, 1000, 300]), 60
+        )
+
+        assert list(offsets) == [0, 2, 2, 4]
+        assert list(normalized) == [1.0, 2.0, 0.5, 1.0]
+        assert list(peaks) == [1, -1, -1]
+
+    def test_compute_tweet_impacts_first_peak_after_tweet(self, prices):
+        """Tests that the first highest price after the tweet is the peak."""
+        hours, normalized, _, peaks = processing.compute_tweet_impacts(
+            *prices, np.array([120]), 180
+        )
+
+        assert peaks[0] == 3
+        assert normalized[peaks[0]] == 2.0
+        assert hours[peaks[0]] == 60 / 3600
+
+
+class TestAverageByRelativeTime:
+    """
+    Test suite for the per-relative-time averaging of tweet windows.
+
+    Validates that prices are averaged across tweets at matching offsets
+    and that the offsets are returned sorted and rounded.
+    """
+
+    def test_average_by_relative_time_means(self):
+        """Tests that prices at the same offset are averaged in order."""
+        hours = np.array([60, 0, -60, 0, 60]) / 3600
+        prices = np.array([2.0, 1.0, 0.5, 1.0, 4.0])
+
+        mean_hours, means = processing.average_by_relative_time(hours, prices)
+
+        assert list(mean_hours) == [-0.0167, 0.0, 0.0167]
+        assert list(means) == [0.5, 1.0, 3.0]
+
+    def test_average_by_relative_time_empty(self):
+        """Tests that no windows give empty results."""
+        mean_hours, means = processing.average_by_relative_time(
+            np.array([]), np.array([])
+        )
+
+        assert len(mean_hours) == 0
+        assert len(means) == 0
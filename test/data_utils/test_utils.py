@@ -38,6 +38,15 @@ class TestDateTimeTransformationsDatetimeToUNIX:
         assert result["ts"].iloc[0] == 1672531200
         assert result["ts"].dtype == "int64"
 
+    def test_convert_datetime_to_unix_timestamp_leaves_input_unchanged(self):
+        """Ensures the caller's DataFrame keeps its original columns."""
+        df = pd.DataFrame({"created_at": ["2023-01-01 00:00:00+00:00"]})
+
+        utils.convert_datetime_to_unix_timestamp(df)
+
+        assert list(df.columns) == ["created_at"]
+        assert df["created_at"].dtype == object
+
     def test_convert_datetime_to_unix_timestamp_invalid_date(self):
         """Ensures a ValueError is raised when encountering malformed date strings."""
         df = pd.DataFrame({"created_at": ["not-a-date"]})